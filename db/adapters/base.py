@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from contextlib import AbstractContextManager
 
+from simulation.core.models.actions import TurnAction
 from simulation.core.models.agent import Agent
 from simulation.core.models.agent_bio import AgentBio
 from simulation.core.models.agent_follow_edge import (
@@ -231,6 +232,28 @@ class RunDatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def aggregate_turn_action_totals(
+        self, run_id: str, *, conn: object
+    ) -> dict[TurnAction, int]:
+        """Sum per-action counts across all turn metadata rows for a run.
+
+        Args:
+            run_id: The ID of the run
+            conn: Connection.
+
+        Returns:
+            Dictionary with every TurnAction as a key; actions absent from all
+            rows (or runs without turns) map to 0.
+
+        Raises:
+            ValueError: If run_id is invalid or a row contains an unknown action type
+            Exception: Database-specific exception if the operation fails.
+                      Implementations should document the specific exception types
+                      they raise.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def write_turn_metadata(
         self,
@@ -905,6 +928,25 @@ class GeneratedFeedDatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def write_generated_feeds(
+        self, feeds: Iterable[GeneratedFeed], *, conn: object
+    ) -> None:
+        """Write several generated feeds in one batched statement.
+
+        Args:
+            feeds: GeneratedFeed models to write
+            conn: Connection.
+
+        Raises:
+            Exception: Database-specific exception if constraints are violated or
+                      the operation fails.
+
+        Note:
+            Same idempotent insert-or-replace semantics as write_generated_feed.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def read_generated_feed(
         self,
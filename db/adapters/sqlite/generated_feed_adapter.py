@@ -2,6 +2,7 @@
 
 import json
 import sqlite3
+from collections.abc import Iterable
 
 from db.adapters.base import GeneratedFeedDatabaseAdapter
 from db.adapters.sqlite.schema_utils import ordered_column_names, required_column_names
@@ -23,6 +24,13 @@ _INSERT_GENERATED_FEED_SQL = (
 )
 
 
+def _generated_feed_row_values(feed: GeneratedFeed) -> tuple:
+    return tuple(
+        json.dumps(feed.post_ids) if col == "post_ids" else getattr(feed, col)
+        for col in GENERATED_FEED_COLUMNS
+    )
+
+
 class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
     """SQLite implementation of GeneratedFeedDatabaseAdapter.
 
@@ -63,11 +71,24 @@ class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
             sqlite3.IntegrityError: If composite key violates constraints
             sqlite3.OperationalError: If database operation fails
         """
-        row_values = tuple(
-            json.dumps(feed.post_ids) if col == "post_ids" else getattr(feed, col)
-            for col in GENERATED_FEED_COLUMNS
+        conn.execute(_INSERT_GENERATED_FEED_SQL, _generated_feed_row_values(feed))
+
+    def write_generated_feeds(
+        self, feeds: Iterable[GeneratedFeed], *, conn: sqlite3.Connection
+    ) -> None:
+        """Write several generated feeds to SQLite with one executemany call.
+
+        Args:
+            feeds: GeneratedFeed models to write
+            conn: Connection.
+
+        Raises:
+            sqlite3.IntegrityError: If composite key violates constraints
+            sqlite3.OperationalError: If database operation fails
+        """
+        conn.executemany(
+            _INSERT_GENERATED_FEED_SQL, map(_generated_feed_row_values, feeds)
         )
-        conn.execute(_INSERT_GENERATED_FEED_SQL, row_values)
 
     @validate_inputs(
         (validate_canonical_agent_id, "agent_id"),
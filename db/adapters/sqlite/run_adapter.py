@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from db.adapters.base import RunDatabaseAdapter
 from db.adapters.sqlite.schema_utils import required_column_names
@@ -35,6 +37,16 @@ def _validate_turn_metadata_row(row: sqlite3.Row) -> None:
             raise ValueError(f"Turn metadata has NULL fields: {col}={row[col]}")
 
 
+# Built once so per-row parsing is a plain dict lookup instead of an Enum call.
+_TURN_ACTION_BY_VALUE: Mapping[str, TurnAction] = MappingProxyType(
+    {action.value: action for action in TurnAction}
+)
+
+# Zero-filled totals template; copying it skips iterating the enum per row.
+# Private and never mutated in place: callers always take ``.copy()``.
+_ZERO_TURN_ACTION_TOTALS: dict[TurnAction, int] = dict.fromkeys(TurnAction, 0)
+
+
 def _parse_total_actions_from_row(row: sqlite3.Row) -> dict[TurnAction, int]:
     """Parse total_actions JSON and convert string keys to TurnAction. Raises ValueError."""
     try:
@@ -44,15 +56,15 @@ def _parse_total_actions_from_row(row: sqlite3.Row) -> dict[TurnAction, int]:
             f"Could not parse total_actions as JSON for turns row: {e}"
         ) from e
     try:
-        merged: dict[TurnAction, int] = {action: 0 for action in TurnAction}
+        merged = _ZERO_TURN_ACTION_TOTALS.copy()
         for k, v in total_actions_dict.items():
-            merged[TurnAction(k)] = int(v)
+            merged[_TURN_ACTION_BY_VALUE[k]] = int(v)
         return merged
     except (ValueError, KeyError) as e:
-        valid_keys = [action.value for action in TurnAction]
         raise ValueError(
             f"Invalid action type in total_actions for turns row: {e}. "
-            f"Expected keys: {valid_keys}, got: {list(total_actions_dict.keys())}"
+            f"Expected keys: {list(_TURN_ACTION_BY_VALUE)}, "
+            f"got: {list(total_actions_dict.keys())}"
         ) from e
 
 
@@ -303,6 +315,49 @@ class SQLiteRunAdapter(RunDatabaseAdapter):
 
         return turn_metadata_list
 
+    @validate_inputs((validate_run_id, "run_id"))
+    def aggregate_turn_action_totals(
+        self, run_id: str, *, conn: sqlite3.Connection
+    ) -> dict[TurnAction, int]:
+        """Sum ``turns.total_actions`` per action for a run inside SQLite.
+
+        Expands each row's JSON with ``json_each`` and aggregates with
+        ``GROUP BY``, so one row per action type is returned instead of one
+        row per turn.
+
+        Args:
+            run_id: The ID of the run
+            conn: Connection.
+
+        Returns:
+            Dictionary with every TurnAction as a key (0 when never recorded).
+
+        Raises:
+            ValueError: If run_id is invalid or a row contains an unknown action type
+            sqlite3.OperationalError: If database operation fails (including
+                malformed total_actions JSON)
+        """
+        rows = conn.execute(
+            """
+            SELECT action_counts.key AS action, SUM(action_counts.value) AS total
+            FROM turns, json_each(turns.total_actions) AS action_counts
+            WHERE turns.run_id = ?
+            GROUP BY action_counts.key
+            """,
+            (run_id,),
+        ).fetchall()
+
+        totals = _ZERO_TURN_ACTION_TOTALS.copy()
+        for row in rows:
+            action = _TURN_ACTION_BY_VALUE.get(row["action"])
+            if action is None:
+                raise ValueError(
+                    f"Invalid action type in total_actions for run {run_id}: "
+                    f"{row['action']!r}. Expected keys: {list(_TURN_ACTION_BY_VALUE)}"
+                )
+            totals[action] = int(row["total"])
+        return totals
+
     def write_turn_metadata(
         self,
         turn_metadata: TurnMetadata,
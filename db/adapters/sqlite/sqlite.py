@@ -38,11 +38,18 @@ def get_connection() -> sqlite3.Connection:
     """Get a database connection.
 
     Returns:
-        SQLite connection to db.sqlite with foreign key enforcement enabled
+        SQLite connection to db.sqlite with foreign key enforcement enabled.
+        Temporary tables/indices stay in memory. Commits use
+        ``synchronous = NORMAL`` only when the file is in WAL mode (set by
+        ``initialize_database``); other journal modes keep SQLite's default.
     """
     conn = sqlite3.connect(get_db_path())
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    if journal_mode == "wal":
+        conn.execute("PRAGMA synchronous = NORMAL")
     return conn
 
 
@@ -198,8 +205,8 @@ def initialize_database() -> None:
 
     Always runs ``alembic upgrade head`` against the configured SQLite file so
     every prior revision (DDL and data) is applied in order before the API or
-    jobs use the DB. Safe to call repeatedly; when already at HEAD, Alembic is a
-    no-op.
+    jobs use the DB, then enables WAL journaling. Safe to call repeatedly; when
+    already at HEAD, Alembic is a no-op.
     """
     from alembic.config import Config
 
@@ -227,6 +234,19 @@ def initialize_database() -> None:
     finally:
         _restore_sim_db_env(old_sim_db_path, old_sim_db_url)
 
+    _enable_wal_journal(db_path)
+
+
+def _enable_wal_journal(db_path: str) -> None:
+    """Switch ``db_path`` to WAL journaling (persisted in the database file).
+
+    WAL lets readers proceed while a writer commits and, paired with the
+    per-connection ``synchronous = NORMAL`` in ``get_connection``, avoids an
+    fsync of the main database file on every commit.
+    """
+    with contextlib.closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("PRAGMA journal_mode = WAL")
+
 
 def _override_custom_db_path():
     configured_path = os.environ.get(SIM_DB_PATH_ENV)
@@ -17,8 +17,12 @@ from simulation.core.models.actions import TurnAction
 TURN_PARENT_PLACEHOLDER_CREATED_AT = "1970_01_01-00:00:00"
 
 
+# TurnAction is fixed at import time, so the zeroed totals JSON is built once.
+_TURN_PARENT_STUB_TOTAL_ACTIONS_JSON: str = json.dumps({k.value: 0 for k in TurnAction})
+
+
 def turn_parent_stub_total_actions_json() -> str:
-    return json.dumps({k.value: 0 for k in TurnAction})
+    return _TURN_PARENT_STUB_TOTAL_ACTIONS_JSON
 
 
 def ensure_turn_parent_stub_for_feed_write(
@@ -1,5 +1,7 @@
 """SQLite implementation of generated feed repositories."""
 
+from collections.abc import Iterable
+
 from db.adapters.base import GeneratedFeedDatabaseAdapter, TransactionProvider
 from db.repositories.interfaces import GeneratedFeedRepository
 from lib.validation_decorators import validate_inputs
@@ -66,6 +68,25 @@ class SQLiteGeneratedFeedRepository(GeneratedFeedRepository):
             self._db_adapter.write_generated_feed(feed, conn=c)
         return feed
 
+    def write_generated_feeds(
+        self, feeds: Iterable[GeneratedFeed], conn: object | None = None
+    ) -> None:
+        """Write several generated feeds to SQLite in one batched insert.
+
+        Args:
+            feeds: GeneratedFeed models to create or update
+            conn: Optional caller-owned transaction connection.
+
+        Raises:
+            sqlite3.IntegrityError: If composite key violates constraints (from adapter)
+            sqlite3.OperationalError: If database operation fails (from adapter)
+        """
+        if conn is not None:
+            self._db_adapter.write_generated_feeds(feeds, conn=conn)
+            return
+        with self._transaction_provider.run_transaction() as c:
+            self._db_adapter.write_generated_feeds(feeds, conn=c)
+
     @validate_inputs(
         (validate_canonical_agent_id, "agent_id"),
         (validate_run_id, "run_id"),
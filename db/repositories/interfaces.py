@@ -8,6 +8,7 @@ implement these interfaces.
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 
+from simulation.core.models.actions import TurnAction
 from simulation.core.models.agent import Agent
 from simulation.core.models.agent_bio import AgentBio
 from simulation.core.models.agent_follow_edge import (
@@ -267,6 +268,24 @@ class RunRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def aggregate_action_totals(self, run_id: str) -> dict[TurnAction, int]:
+        """Sum per-action counts across all turns of a run.
+
+        Aggregated in the database over the ``turns`` table rather than by
+        loading every TurnMetadata row.
+
+        Args:
+            run_id: The ID of the run
+
+        Returns:
+            Dictionary with every TurnAction as a key; 0 for actions never recorded.
+
+        Raises:
+            ValueError: If run_id is empty
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def write_turn_metadata(
         self,
@@ -841,6 +860,21 @@ class GeneratedFeedRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def write_generated_feeds(
+        self, feeds: Iterable[GeneratedFeed], conn: object | None = None
+    ) -> None:
+        """Write several generated feeds in one batched write.
+
+        Args:
+            feeds: GeneratedFeed models to create or update
+            conn: Optional caller-owned transaction connection.
+
+        Note:
+            Same idempotent semantics as write_generated_feed.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_generated_feed(
         self, agent_id: str, run_id: str, turn_number: int
@@ -7,6 +7,7 @@ from db.repositories.interfaces import RunRepository
 from lib.timestamp_utils import get_current_timestamp
 from lib.validation_decorators import validate_inputs
 from simulation.core.metrics.defaults import get_default_metric_keys
+from simulation.core.models.actions import TurnAction
 from simulation.core.models.runs import Run, RunConfig, RunStatus
 from simulation.core.models.turns import TurnMetadata
 from simulation.core.utils.exceptions import (
@@ -219,6 +220,24 @@ class SQLiteRunRepository(RunRepository):
         with self._transaction_provider.run_transaction() as c:
             return self._db_adapter.read_turn_metadata_for_run(run_id, conn=c)
 
+    @validate_inputs((validate_run_id, "run_id"))
+    def aggregate_action_totals(self, run_id: str) -> dict[TurnAction, int]:
+        """Sum per-action counts across a run's ``turns`` rows in the database.
+
+        Args:
+            run_id: The ID of the run
+
+        Returns:
+            Dictionary with every TurnAction as a key; 0 for actions never recorded.
+
+        Raises:
+            ValueError: If run_id is empty
+            ValueError: If a row contains an unknown action type
+            Exception: Database-specific exceptions from the adapter
+        """
+        with self._transaction_provider.run_transaction() as c:
+            return self._db_adapter.aggregate_turn_action_totals(run_id, conn=c)
+
     def write_turn_metadata(
         self,
         turn_metadata: TurnMetadata,
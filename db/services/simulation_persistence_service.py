@@ -92,10 +92,9 @@ class SimulationPersistenceService:
             self._run_repo.write_turn_metadata(turn_metadata, conn=conn)
             self._metrics_repo.write_turn_metrics(turn_metrics, conn=conn)
             if generated_feeds:
-                for generated_feed in generated_feeds:
-                    self._generated_feed_repo.write_generated_feed(
-                        generated_feed, conn=conn
-                    )
+                self._generated_feed_repo.write_generated_feeds(
+                    generated_feeds, conn=conn
+                )
             if likes:
                 self._like_repo.write_likes(run_id, turn_number, likes, conn=conn)
             if comments:
@@ -103,20 +103,29 @@ def load_candidate_posts(
     run_post_like_repo: RunPostLikeRepository,
     run_post_comment_repo: RunPostCommentRepository,
     turn_post_repo: TurnPostRepository,
+    posts: list[Post] | None = None,
 ) -> list[Post]:
     """Load the candidate posts for the feeds from run_posts.
 
     Remove posts that:
     - The agent has already seen.
     - The agent themselves posted (or their original Bluesky profile posted)
+
+    ``posts`` is the turn's unfiltered ``load_posts`` result. Callers building
+    feeds for many agents pass it so the run/turn post queries run once per
+    turn instead of once per agent.
     """
-    candidate_posts: list[Post] = load_posts(
-        run_id=run_id,
-        run_post_repo=run_post_repo,
-        run_post_like_repo=run_post_like_repo,
-        run_post_comment_repo=run_post_comment_repo,
-        turn_post_repo=turn_post_repo,
-        before_turn_number=turn_number,
+    candidate_posts: list[Post] = (
+        posts
+        if posts is not None
+        else load_posts(
+            run_id=run_id,
+            run_post_repo=run_post_repo,
+            run_post_like_repo=run_post_like_repo,
+            run_post_comment_repo=run_post_comment_repo,
+            turn_post_repo=turn_post_repo,
+            before_turn_number=turn_number,
+        )
     )
     return filter_candidate_posts(
         candidate_posts=candidate_posts,
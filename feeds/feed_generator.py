@@ -11,7 +11,7 @@ from db.repositories.interfaces import (
     TurnPostRepository,
 )
 from feeds.algorithms import FeedAlgorithmResult, get_feed_generator
-from feeds.candidate_generation import load_candidate_posts
+from feeds.candidate_generation import load_candidate_posts, load_posts
 from feeds.constants import MAX_POSTS_PER_FEED
 from feeds.interfaces import FeedGenerationResult
 from lib.timestamp_utils import get_current_timestamp
@@ -105,6 +105,17 @@ def _generate_feeds(
 ) -> dict[str, GeneratedFeed]:
     """Generate a feed per agent via the feed algorithm; no persistence."""
     feeds: dict[str, GeneratedFeed] = {}
+    if not agents:
+        return feeds
+    # Run + prior-turn posts are the same for every agent this turn; load once.
+    posts: list[Post] = load_posts(
+        run_id=run_id,
+        run_post_repo=run_post_repo,
+        run_post_like_repo=run_post_like_repo,
+        run_post_comment_repo=run_post_comment_repo,
+        turn_post_repo=turn_post_repo,
+        before_turn_number=turn_number,
+    )
     for agent in agents:
         feed = _generate_single_agent_feed(
             agent=agent,
@@ -117,6 +128,7 @@ def _generate_feeds(
             run_post_like_repo=run_post_like_repo,
             run_post_comment_repo=run_post_comment_repo,
             turn_post_repo=turn_post_repo,
+            posts=posts,
         )
         feeds[agent.handle] = feed
     return feeds
@@ -203,6 +215,8 @@ def _log_warning_missing_posts(
     turn_number: int,
 ) -> None:
     """Log one aggregated warning per agent for missing post IDs (first 5 IDs shown, then count)."""
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     for agent_handle, missing_post_ids in missing_post_ids_by_agent.items():
         feed_id = feeds[agent_handle].feed_id
         missing_count = len(missing_post_ids)
@@ -211,8 +225,14 @@ def _log_warning_missing_posts(
         if len(missing_post_ids) > 5:
             ids_str += f", ... ({missing_count - 5} more)"
         logger.warning(
-            f"Missing {missing_count} post(s) for agent {agent_handle} in run {run_id}, "
-            f"turn {turn_number} (feed_id={feed_id}). Missing post_ids: {ids_str}"
+            "Missing %d post(s) for agent %s in run %s, turn %d (feed_id=%s). "
+            "Missing post_ids: %s",
+            missing_count,
+            agent_handle,
+            run_id,
+            turn_number,
+            feed_id,
+            ids_str,
         )
 
 
@@ -258,6 +278,7 @@ def _generate_single_agent_feed(
     run_post_like_repo: RunPostLikeRepository,
     run_post_comment_repo: RunPostCommentRepository,
     turn_post_repo: TurnPostRepository,
+    posts: list[Post] | None = None,
 ) -> GeneratedFeed:
     """Load candidate posts for one agent, run the feed algorithm, and return the generated feed (no persistence)."""
     candidate_posts: list[Post] = load_candidate_posts(
@@ -269,6 +290,7 @@ def _generate_single_agent_feed(
         run_post_like_repo=run_post_like_repo,
         run_post_comment_repo=run_post_comment_repo,
         turn_post_repo=turn_post_repo,
+        posts=posts,
     )
     return _generate_feed(
         agent=agent,
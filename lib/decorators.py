@@ -9,8 +9,8 @@ from typing import Any, ParamSpec, TypeVar, overload
 
 logger = logging.getLogger(__name__)
 
-# Scale factor for converting seconds to milliseconds (used for elapsed_ms).
-SECONDS_TO_MS: float = 1000.0
+# Integer divisor for converting perf_counter_ns() deltas to elapsed_ms.
+NS_PER_MS: int = 1_000_000
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -54,7 +54,7 @@ def timed(
 
             @wraps(func)
             async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> object:
-                start = time.perf_counter()
+                start = time.perf_counter_ns()
                 try:
                     return await func(*args, **kwargs)
                 finally:
@@ -70,7 +70,7 @@ def timed(
 
         @wraps(func)
         def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> object:
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             try:
                 return func(*args, **kwargs)
             finally:
@@ -90,23 +90,24 @@ def timed(
 def _after_call(
     *,
     func: Callable[..., Any],
-    start: float,
+    start: int,
     log_level: int | None,
     attach_attr: str | None,
     first_arg: Any,
 ) -> None:
     """Log elapsed time and optionally attach duration to the first argument.
 
-    Inputs: func (for qualname and log message), start time, optional
-    log_level and attach_attr, and first_arg (the first positional argument
-    of the wrapped call). Output: none. Logs at log_level when set; then, when
-    attach_attr and first_arg are set, writes elapsed_ms onto first_arg.state
-    (or first_arg if no .state). Attribute get/set is best-effort: any
-    exception from getattr/hasattr/setattr is caught, logged with
-    attach_attr and func.__qualname__, and suppressed so it never masks the
-    wrapped function's exception.
+    Inputs: func (for qualname and log message), start time (from
+    ``time.perf_counter_ns``), optional log_level and attach_attr, and
+    first_arg (the first positional argument of the wrapped call). Output:
+    none. Logs at log_level when set; then, when attach_attr and first_arg
+    are set, writes elapsed_ms onto first_arg.state (or first_arg if no
+    .state). Attribute get/set is best-effort: any exception from
+    getattr/hasattr/setattr is caught, logged with attach_attr and
+    func.__qualname__, and suppressed so it never masks the wrapped
+    function's exception.
     """
-    elapsed_ms = int((time.perf_counter() - start) * SECONDS_TO_MS)
+    elapsed_ms = (time.perf_counter_ns() - start) // NS_PER_MS
     if log_level is not None:
         logger.log(log_level, "%s completed in %dms", func.__qualname__, elapsed_ms)
     if attach_attr and first_arg is not None:
@@ -7,10 +7,10 @@ and hardcoded text to decide whether to comment and which text to use.
 from __future__ import annotations
 
 import random
-from datetime import datetime, timezone
 
-from lib.timestamp_utils import CREATED_AT_FORMAT, get_current_timestamp
+from lib.timestamp_utils import get_current_timestamp
 from simulation.core.action_generators.interfaces import CommentGenerator
+from simulation.core.action_generators.utils.random_simple_utils import recency_score
 from simulation.core.models.actions import Comment
 from simulation.core.models.generated.base import GenerationMetadata
 from simulation.core.models.generated.comment import GeneratedComment
@@ -78,7 +78,7 @@ class RandomSimpleCommentGenerator(CommentGenerator):
 
 def _score_post(post: Post) -> float:
     """Compute score for a post (recency + social proof)."""
-    recency = _recency_score(post.created_at)
+    recency = recency_score(post.created_at)
     social = (
         post.like_count * LIKE_COUNT_WEIGHT
         + post.repost_count * REPOST_WEIGHT
@@ -87,16 +87,6 @@ def _score_post(post: Post) -> float:
     return recency * RECENCY_WEIGHT + social
 
 
-def _recency_score(created_at: str) -> float:
-    """Convert created_at to a numeric recency score (higher = newer)."""
-    try:
-        dt = datetime.strptime(created_at, CREATED_AT_FORMAT)
-        dt = dt.replace(tzinfo=timezone.utc)
-        return float(dt.timestamp())
-    except (ValueError, TypeError):
-        return 0.0
-
-
 def _should_comment(
     *,
     run_id: str,
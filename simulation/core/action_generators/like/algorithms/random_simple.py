@@ -6,11 +6,12 @@ to decide whether to like each.
 
 from __future__ import annotations
 
+import heapq
 import random
-from datetime import datetime, timezone
 
-from lib.timestamp_utils import CREATED_AT_FORMAT, get_current_timestamp
+from lib.timestamp_utils import get_current_timestamp
 from simulation.core.action_generators.interfaces import LikeGenerator
+from simulation.core.action_generators.utils.random_simple_utils import recency_score
 from simulation.core.models.actions import Like
 from simulation.core.models.generated.base import GenerationMetadata
 from simulation.core.models.generated.like import GeneratedLike
@@ -42,10 +43,12 @@ class RandomSimpleLikeGenerator(LikeGenerator):
         if not candidates:
             return []
 
-        scored = [(_score_post(post), post) for post in candidates]
-        scored.sort(key=lambda x: (-x[0], x[1].post_id))
-        selected = [post for _, post in scored[:TOP_K_POSTS_TO_LIKE]]
+        ranked = _rank_candidates(candidates, TOP_K_POSTS_TO_LIKE)
+        selected = [candidates[index] for *_, index in ranked]
 
+        # Built once per call; each like only appends its post_id.
+        like_id_prefix = f"like_{run_id}_{turn_number}_{agent_handle}_"
+        created_at = get_current_timestamp()
         generated: list[GeneratedLike] = []
         for post in selected:
             if not _should_like():
@@ -53,19 +56,33 @@ class RandomSimpleLikeGenerator(LikeGenerator):
             generated.append(
                 _build_generated_like(
                     post=post,
-                    agent_handle=agent_handle,
                     agent_id=agent_id,
-                    run_id=run_id,
-                    turn_number=turn_number,
+                    like_id_prefix=like_id_prefix,
+                    created_at=created_at,
                 )
             )
 
         return generated
 
 
+def _rank_candidates(candidates: list[Post], k: int) -> list[tuple[float, str, int]]:
+    """Score all candidates in one pass and return the best ``k``, best-first.
+
+    Keys are ``(-score, post_id, index)`` tuples built once per candidate, so
+    selection compares plain tuples instead of calling a key function and the
+    caller maps ``index`` back to the post. ``heapq.nsmallest`` keeps only
+    ``k`` entries instead of sorting the whole candidate list.
+    """
+    ranked = [
+        (-_score_post(post), post.post_id, index)
+        for index, post in enumerate(candidates)
+    ]
+    return heapq.nsmallest(k, ranked)
+
+
 def _score_post(post: Post) -> float:
     """Compute score for a post (recency + social proof)."""
-    recency = _recency_score(post.created_at)
+    recency = recency_score(post.created_at)
     social = (
         post.like_count * LIKE_COUNT_WEIGHT
         + post.repost_count * REPOST_WEIGHT
@@ -74,16 +91,6 @@ def _score_post(post: Post) -> float:
     return recency * RECENCY_WEIGHT + social
 
 
-def _recency_score(created_at: str) -> float:
-    """Convert created_at to a numeric recency score (higher = newer)."""
-    try:
-        dt = datetime.strptime(created_at, CREATED_AT_FORMAT)
-        dt = dt.replace(tzinfo=timezone.utc)
-        return float(dt.timestamp())
-    except (ValueError, TypeError):
-        return 0.0
-
-
 def _should_like() -> bool:
     """Return whether to like using random probability in [0, 1)."""
     return random.random() < LIKE_PROBABILITY  # nosec B311
@@ -92,18 +99,15 @@ def _should_like() -> bool:
 def _build_generated_like(
     *,
     post: Post,
-    agent_handle: str,
     agent_id: str,
-    run_id: str,
-    turn_number: int,
+    like_id_prefix: str,
+    created_at: str,
 ) -> GeneratedLike:
     """Build a GeneratedLike with IDs and metadata."""
     post_id = post.post_id
-    like_id = f"like_{run_id}_{turn_number}_{agent_handle}_{post_id}"
-    created_at = get_current_timestamp()
     return GeneratedLike(
         like=Like(
-            like_id=like_id,
+            like_id=like_id_prefix + post_id,
             agent_id=agent_id,
             post_id=post_id,
             created_at=created_at,
@@ -17,7 +17,9 @@ from simulation.core.action_generators.validators import (
     COMMENT_ALGORITHMS,
     FOLLOW_ALGORITHMS,
     LIKE_ALGORITHMS,
-    validate_algorithm,
+    validate_comment_algorithm,
+    validate_follow_algorithm,
+    validate_like_algorithm,
 )
 
 
@@ -87,36 +89,56 @@ _COMMENT_ALGORITHM_FACTORIES: dict[str, Callable[[], CommentGenerator]] = {
 }
 assert set(_COMMENT_ALGORITHM_FACTORIES.keys()) == set(COMMENT_ALGORITHMS)  # nosec B101
 
-_like_generator_cache: dict[str, LikeGenerator] = {}
-_follow_generator_cache: dict[str, FollowGenerator] = {}
-_comment_generator_cache: dict[str, CommentGenerator] = {}
+# Keyed by both the caller's argument (including None for the configured
+# default) and the resolved name, so repeat lookups skip config resolution.
+_like_generator_cache: dict[str | None, LikeGenerator] = {}
+_follow_generator_cache: dict[str | None, FollowGenerator] = {}
+_comment_generator_cache: dict[str | None, CommentGenerator] = {}
 
 
 def get_like_generator(algorithm: str | None = None) -> LikeGenerator:
     """Return a LikeGenerator. Uses config default when algorithm is omitted."""
+    generator = _like_generator_cache.get(algorithm)
+    if generator is not None:
+        return generator
     resolved: str = resolve_algorithm("like", algorithm)
-    validate_algorithm("like", resolved)
-    if resolved not in _like_generator_cache:
-        _like_generator_cache[resolved] = _create_like_generator(resolved)
-    return _like_generator_cache[resolved]
+    validate_like_algorithm(resolved)
+    generator = _like_generator_cache.get(resolved)
+    if generator is None:
+        generator = _create_like_generator(resolved)
+        _like_generator_cache[resolved] = generator
+    _like_generator_cache[algorithm] = generator
+    return generator
 
 
 def get_follow_generator(algorithm: str | None = None) -> FollowGenerator:
     """Return a FollowGenerator. Uses config default when algorithm is omitted."""
+    generator = _follow_generator_cache.get(algorithm)
+    if generator is not None:
+        return generator
     resolved: str = resolve_algorithm("follow", algorithm)
-    validate_algorithm("follow", resolved)
-    if resolved not in _follow_generator_cache:
-        _follow_generator_cache[resolved] = _create_follow_generator(resolved)
-    return _follow_generator_cache[resolved]
+    validate_follow_algorithm(resolved)
+    generator = _follow_generator_cache.get(resolved)
+    if generator is None:
+        generator = _create_follow_generator(resolved)
+        _follow_generator_cache[resolved] = generator
+    _follow_generator_cache[algorithm] = generator
+    return generator
 
 
 def get_comment_generator(algorithm: str | None = None) -> CommentGenerator:
     """Return a CommentGenerator. Uses config default when algorithm is omitted."""
+    generator = _comment_generator_cache.get(algorithm)
+    if generator is not None:
+        return generator
     resolved: str = resolve_algorithm("comment", algorithm)
-    validate_algorithm("comment", resolved)
-    if resolved not in _comment_generator_cache:
-        _comment_generator_cache[resolved] = _create_comment_generator(resolved)
-    return _comment_generator_cache[resolved]
+    validate_comment_algorithm(resolved)
+    generator = _comment_generator_cache.get(resolved)
+    if generator is None:
+        generator = _create_comment_generator(resolved)
+        _comment_generator_cache[resolved] = generator
+    _comment_generator_cache[algorithm] = generator
+    return generator
 
 
 def _create_like_generator(algorithm: str) -> LikeGenerator:
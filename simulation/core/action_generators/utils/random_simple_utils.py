@@ -0,0 +1,27 @@
+"""Shared scoring utilities for random-simple action generators.
+
+Public API: ``recency_score`` and its memoization bound ``RECENCY_SCORE_CACHE_SIZE``.
+"""
+
+from __future__ import annotations
+
+import functools
+from datetime import datetime, timezone
+
+from lib.timestamp_utils import CREATED_AT_FORMAT
+
+# Upper bound on distinct created_at strings memoized by ``recency_score``.
+RECENCY_SCORE_CACHE_SIZE: int = 65536
+
+
+# Feed posts recur across agents, turns and action types, so each distinct
+# timestamp is parsed with strptime only once.
+@functools.lru_cache(maxsize=RECENCY_SCORE_CACHE_SIZE)
+def recency_score(created_at: str) -> float:
+    """Convert created_at to a numeric recency score (higher = newer)."""
+    try:
+        dt = datetime.strptime(created_at, CREATED_AT_FORMAT)
+        dt = dt.replace(tzinfo=timezone.utc)
+        return float(dt.timestamp())
+    except (ValueError, TypeError):
+        return 0.0
@@ -1,5 +1,7 @@
 """Validators for action generators."""
 
+from collections.abc import Callable
+
 from lib.validation_utils import validate_value_in_set
 
 LIKE_ALGORITHMS: tuple[str, ...] = ("random_simple", "naive_llm")
@@ -38,3 +40,34 @@ def validate_algorithm(action_type: str, algorithm: str) -> str:
         allowed,
         allowed_display_name=str(allowed),
     )
+
+
+def _make_algorithm_validator(
+    action_type: str, allowed: tuple[str, ...]
+) -> Callable[[str], str]:
+    """Bind the allowed set for one action type so callers skip the dispatch lookup."""
+    allowed_set: frozenset[str] = frozenset(allowed)
+    field_name = f"{action_type}_algorithm"
+    allowed_display_name = str(allowed)
+
+    def validate(algorithm: str) -> str:
+        return validate_value_in_set(
+            algorithm,
+            field_name,
+            allowed_set,
+            allowed_display_name=allowed_display_name,
+        )
+
+    validate.__name__ = f"validate_{action_type}_algorithm"
+    return validate
+
+
+validate_like_algorithm: Callable[[str], str] = _make_algorithm_validator(
+    "like", LIKE_ALGORITHMS
+)
+validate_follow_algorithm: Callable[[str], str] = _make_algorithm_validator(
+    "follow", FOLLOW_ALGORITHMS
+)
+validate_comment_algorithm: Callable[[str], str] = _make_algorithm_validator(
+    "comment", COMMENT_ALGORITHMS
+)
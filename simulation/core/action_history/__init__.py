@@ -1,13 +1,23 @@
 from simulation.core.action_history.factories import (
     create_default_action_history_store_factory,
 )
-from simulation.core.action_history.interfaces import ActionHistoryStore
-from simulation.core.action_history.recording import record_action_targets
+from simulation.core.action_history.interfaces import (
+    ActionHistoryStore,
+    AgentActionTargetRecord,
+    AgentActionTargets,
+)
+from simulation.core.action_history.recording import (
+    record_action_targets,
+    record_turn_action_targets,
+)
 from simulation.core.action_history.stores import InMemoryActionHistoryStore
 
 __all__ = [
     "ActionHistoryStore",
+    "AgentActionTargetRecord",
+    "AgentActionTargets",
     "InMemoryActionHistoryStore",
     "record_action_targets",
+    "record_turn_action_targets",
     "create_default_action_history_store_factory",
 ]
@@ -1,6 +1,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Set
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AgentActionTargets:
+    """Read-only view of one agent's previously accepted action targets."""
+
+    liked_post_ids: Set[str]
+    commented_post_ids: Set[str]
+    followed_agent_ids: Set[str]
+
+
+@dataclass(frozen=True)
+class AgentActionTargetRecord:
+    """One agent's validated action targets for a turn, pending recording."""
+
+    agent_id: str
+    like_post_ids: list[str]
+    comment_post_ids: list[str]
+    follow_target_agent_ids: list[str]
 
 
 class ActionHistoryStore(ABC):
@@ -18,6 +39,11 @@ class ActionHistoryStore(ABC):
     def has_followed(self, run_id: str, agent_id: str, target_agent_id: str) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_action_targets(self, run_id: str, agent_id: str) -> AgentActionTargets:
+        """Return all of the agent's recorded targets in one lookup."""
+        raise NotImplementedError
+
     @abstractmethod
     def record_like(self, run_id: str, agent_id: str, post_id: str) -> None:
         raise NotImplementedError
@@ -29,3 +55,19 @@ class ActionHistoryStore(ABC):
     @abstractmethod
     def record_follow(self, run_id: str, agent_id: str, target_agent_id: str) -> None:
         raise NotImplementedError
+
+    def record_turn_targets(
+        self, run_id: str, records: Iterable[AgentActionTargetRecord]
+    ) -> None:
+        """Record every agent's validated targets for one turn in a single call.
+
+        Stores backed by I/O should override this to write the whole turn at
+        once; the default falls back to the per-target ``record_*`` methods.
+        """
+        for record in records:
+            for post_id in record.like_post_ids:
+                self.record_like(run_id, record.agent_id, post_id)
+            for post_id in record.comment_post_ids:
+                self.record_comment(run_id, record.agent_id, post_id)
+            for target_agent_id in record.follow_target_agent_ids:
+                self.record_follow(run_id, record.agent_id, target_agent_id)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from simulation.core.action_history.interfaces import ActionHistoryStore
+from collections.abc import Iterable
+
+from simulation.core.action_history.interfaces import (
+    ActionHistoryStore,
+    AgentActionTargetRecord,
+)
 
 
 def record_action_targets(
@@ -19,3 +24,13 @@ def record_action_targets(
         action_history_store.record_comment(run_id, agent_id, post_id)
     for target_agent_id in follow_target_agent_ids:
         action_history_store.record_follow(run_id, agent_id, target_agent_id)
+
+
+def record_turn_action_targets(
+    *,
+    run_id: str,
+    records: Iterable[AgentActionTargetRecord],
+    action_history_store: ActionHistoryStore,
+) -> None:
+    """Record all agents' validated action targets for a turn in one store call."""
+    action_history_store.record_turn_targets(run_id, records)
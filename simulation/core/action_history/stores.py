@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable, Mapping, Set
+from types import MappingProxyType
 
-from simulation.core.action_history.interfaces import ActionHistoryStore
+from simulation.core.action_history.interfaces import (
+    ActionHistoryStore,
+    AgentActionTargetRecord,
+    AgentActionTargets,
+)
+
+_EMPTY_TARGETS_BY_AGENT_ID: Mapping[str, set[str]] = MappingProxyType({})
+_EMPTY_TARGETS: frozenset[str] = frozenset()
 
 
 class InMemoryActionHistoryStore(ActionHistoryStore):
@@ -20,13 +29,29 @@ class InMemoryActionHistoryStore(ActionHistoryStore):
         )
 
     def has_liked(self, run_id: str, agent_id: str, post_id: str) -> bool:
-        return post_id in self._likes_by_run_agent_id[run_id][agent_id]
+        return post_id in _read_targets(self._likes_by_run_agent_id, run_id, agent_id)
 
     def has_commented(self, run_id: str, agent_id: str, post_id: str) -> bool:
-        return post_id in self._comments_by_run_agent_id[run_id][agent_id]
+        return post_id in _read_targets(
+            self._comments_by_run_agent_id, run_id, agent_id
+        )
 
     def has_followed(self, run_id: str, agent_id: str, target_agent_id: str) -> bool:
-        return target_agent_id in self._follows_by_run_agent_id[run_id][agent_id]
+        return target_agent_id in _read_targets(
+            self._follows_by_run_agent_id, run_id, agent_id
+        )
+
+    def get_action_targets(self, run_id: str, agent_id: str) -> AgentActionTargets:
+        """Return the agent's recorded target sets for bulk membership checks."""
+        return AgentActionTargets(
+            liked_post_ids=_read_targets(self._likes_by_run_agent_id, run_id, agent_id),
+            commented_post_ids=_read_targets(
+                self._comments_by_run_agent_id, run_id, agent_id
+            ),
+            followed_agent_ids=_read_targets(
+                self._follows_by_run_agent_id, run_id, agent_id
+            ),
+        )
 
     def record_like(self, run_id: str, agent_id: str, post_id: str) -> None:
         self._likes_by_run_agent_id[run_id][agent_id].add(post_id)
@@ -36,3 +61,29 @@ class InMemoryActionHistoryStore(ActionHistoryStore):
 
     def record_follow(self, run_id: str, agent_id: str, target_agent_id: str) -> None:
         self._follows_by_run_agent_id[run_id][agent_id].add(target_agent_id)
+
+    def record_turn_targets(
+        self, run_id: str, records: Iterable[AgentActionTargetRecord]
+    ) -> None:
+        likes = self._likes_by_run_agent_id[run_id]
+        comments = self._comments_by_run_agent_id[run_id]
+        follows = self._follows_by_run_agent_id[run_id]
+        for record in records:
+            # Skip empty target lists so no empty per-agent sets are created.
+            if record.like_post_ids:
+                likes[record.agent_id].update(record.like_post_ids)
+            if record.comment_post_ids:
+                comments[record.agent_id].update(record.comment_post_ids)
+            if record.follow_target_agent_ids:
+                follows[record.agent_id].update(record.follow_target_agent_ids)
+
+
+def _read_targets(
+    targets_by_run_agent_id: dict[str, dict[str, set[str]]],
+    run_id: str,
+    agent_id: str,
+) -> Set[str]:
+    """Look up recorded targets without materializing empty ``defaultdict`` entries."""
+    return targets_by_run_agent_id.get(run_id, _EMPTY_TARGETS_BY_AGENT_ID).get(
+        agent_id, _EMPTY_TARGETS
+    )
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from simulation.core.action_history.interfaces import ActionHistoryStore
+from simulation.core.action_history.interfaces import (
+    ActionHistoryStore,
+    AgentActionTargets,
+)
 from simulation.core.action_policy.interfaces import AgentActionFeedFilter
 from simulation.core.models.posts import Post
 
@@ -21,8 +24,41 @@ def _follow_target_key_for_history(post: Post) -> str:
     return post.author_agent_id
 
 
+def partition_feed_by_targets(
+    feed: list[Post], targets: AgentActionTargets
+) -> ActionCandidateFeeds:
+    """Split ``feed`` into candidates in one pass using recorded-target sets.
+
+    Each post is visited once and routed to every action list it is eligible
+    for; set ``__contains__`` and list ``append`` are bound up front so the
+    per-post work is plain C-level calls.
+    """
+    is_liked = targets.liked_post_ids.__contains__
+    is_commented = targets.commented_post_ids.__contains__
+    is_followed = targets.followed_agent_ids.__contains__
+    like_candidates: list[Post] = []
+    comment_candidates: list[Post] = []
+    follow_candidates: list[Post] = []
+    add_like = like_candidates.append
+    add_comment = comment_candidates.append
+    add_follow = follow_candidates.append
+    for post in feed:
+        post_id = post.post_id
+        if not is_liked(post_id):
+            add_like(post)
+        if not is_commented(post_id):
+            add_comment(post)
+        if not is_followed(_follow_target_key_for_history(post)):
+            add_follow(post)
+    return ActionCandidateFeeds(
+        like_candidates=like_candidates,
+        comment_candidates=comment_candidates,
+        follow_candidates=follow_candidates,
+    )
+
+
 class HistoryAwareActionFeedFilter(AgentActionFeedFilter):
-    """Default candidate filter backed by action history checks."""
+    """Default candidate filter backed by a per-agent action history snapshot."""
 
     def filter_candidates(
         self,
@@ -34,27 +70,6 @@ class HistoryAwareActionFeedFilter(AgentActionFeedFilter):
         action_history_store: ActionHistoryStore,
     ) -> ActionCandidateFeeds:
         _ = agent_handle
-        like_candidates = [
-            post
-            for post in feed
-            if not action_history_store.has_liked(run_id, agent_id, post.post_id)
-        ]
-        comment_candidates = [
-            post
-            for post in feed
-            if not action_history_store.has_commented(run_id, agent_id, post.post_id)
-        ]
-        follow_candidates = [
-            post
-            for post in feed
-            if not action_history_store.has_followed(
-                run_id,
-                agent_id,
-                _follow_target_key_for_history(post),
-            )
-        ]
-        return ActionCandidateFeeds(
-            like_candidates=like_candidates,
-            comment_candidates=comment_candidates,
-            follow_candidates=follow_candidates,
+        return partition_feed_by_targets(
+            feed, action_history_store.get_action_targets(run_id, agent_id)
         )
@@ -1,150 +1,57 @@
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Iterable, Set
+from operator import attrgetter
 
-from simulation.core.action_history.interfaces import ActionHistoryStore
+from simulation.core.action_history.interfaces import (
+    ActionHistoryStore,
+    AgentActionTargets,
+)
 from simulation.core.agent_actions import MAX_AUTHORED_POSTS_PER_TURN
-from simulation.core.models.actions import TurnAction
 from simulation.core.models.generated.comment import GeneratedComment
 from simulation.core.models.generated.follow import GeneratedFollow
 from simulation.core.models.generated.like import GeneratedLike
 from simulation.core.models.turn_posts import TurnPostSnapshot
 
-# Type alias for duplicate validator: (validator, run_id, turn_number, agent_handle, identifiers) -> None
-_DuplicateValidator = Callable[
-    ["AgentActionRulesValidator", str, int, str, list[str]], None
-]
-# Type alias for history validator
-_HistoryValidator = Callable[
-    [
-        "AgentActionRulesValidator",
-        str,
-        int,
-        str,
-        str,
-        list[str],
-        ActionHistoryStore,
-    ],
-    None,
-]
-
-
-def _dispatch_duplicate_like(
-    validator: AgentActionRulesValidator,
-    run_id: str,
-    turn_number: int,
-    agent_handle: str,
-    identifiers: list[str],
-) -> None:
-    validator._validate_duplicate_likes(
-        run_id=run_id,
-        turn_number=turn_number,
-        agent_handle=agent_handle,
-        like_post_ids=identifiers,
-    )
-
-
-def _dispatch_duplicate_comment(
-    validator: AgentActionRulesValidator,
-    run_id: str,
-    turn_number: int,
-    agent_handle: str,
-    identifiers: list[str],
-) -> None:
-    validator._validate_duplicate_comments(
-        run_id=run_id,
-        turn_number=turn_number,
-        agent_handle=agent_handle,
-        comment_post_ids=identifiers,
-    )
-
-
-def _dispatch_duplicate_follow(
-    validator: AgentActionRulesValidator,
-    run_id: str,
-    turn_number: int,
-    agent_handle: str,
-    identifiers: list[str],
-) -> None:
-    validator._validate_duplicate_follows(
-        run_id=run_id,
-        turn_number=turn_number,
-        agent_handle=agent_handle,
-        follow_target_agent_ids=identifiers,
-    )
-
-
-def _dispatch_history_like(
-    validator: AgentActionRulesValidator,
-    run_id: str,
-    turn_number: int,
-    agent_handle: str,
-    agent_id: str,
-    identifiers: list[str],
-    action_history_store: ActionHistoryStore,
-) -> None:
-    validator._validate_previously_liked(
-        run_id=run_id,
-        turn_number=turn_number,
-        agent_handle=agent_handle,
-        agent_id=agent_id,
-        like_post_ids=identifiers,
-        action_history_store=action_history_store,
+# C-level attribute extraction for the per-agent id lists.
+_like_post_id = attrgetter("like.post_id")
+_comment_post_id = attrgetter("comment.post_id")
+_follow_target_agent_id = attrgetter("follow.target_agent_id")
+
+
+def _collect_target_ids(identifiers: Iterable[str]) -> tuple[list[str], list[str]]:
+    """Return ``(ids, duplicates)`` for ``identifiers``.
+
+    ``duplicates`` lists each repeated identifier once, in first-repeat order.
+    Zero or one identifier cannot repeat, so no ``set`` is built; otherwise the
+    common no-duplicates case is decided by a single ``set`` build and the
+    Python-level scan only runs when a duplicate exists.
+    """
+    ids = list(identifiers)
+    if len(ids) < 2 or len(set(ids)) == len(ids):
+        return ids, []
+    seen: set[str] = set()
+    duplicates: dict[str, None] = {}
+    for identifier in ids:
+        if identifier in seen:
+            duplicates[identifier] = None
+        else:
+            seen.add(identifier)
+    return ids, list(duplicates)
+
+
+def _first_previously_targeted(
+    identifiers: list[str], previous_targets: Set[str]
+) -> str | None:
+    """Return the first identifier already in ``previous_targets``, if any."""
+    if previous_targets.isdisjoint(identifiers):
+        return None
+    return next(
+        identifier for identifier in identifiers if identifier in previous_targets
     )
 
 
-def _dispatch_history_comment(
-    validator: AgentActionRulesValidator,
-    run_id: str,
-    turn_number: int,
-    agent_handle: str,
-    agent_id: str,
-    identifiers: list[str],
-    action_history_store: ActionHistoryStore,
-) -> None:
-    validator._validate_previously_commented(
-        run_id=run_id,
-        turn_number=turn_number,
-        agent_handle=agent_handle,
-        agent_id=agent_id,
-        comment_post_ids=identifiers,
-        action_history_store=action_history_store,
-    )
-
-
-def _dispatch_history_follow(
-    validator: AgentActionRulesValidator,
-    run_id: str,
-    turn_number: int,
-    agent_handle: str,
-    agent_id: str,
-    identifiers: list[str],
-    action_history_store: ActionHistoryStore,
-) -> None:
-    validator._validate_previously_followed(
-        run_id=run_id,
-        turn_number=turn_number,
-        agent_handle=agent_handle,
-        agent_id=agent_id,
-        follow_target_agent_ids=identifiers,
-        action_history_store=action_history_store,
-    )
-
-
-_DUPLICATE_DISPATCH: dict[TurnAction, _DuplicateValidator] = {
-    TurnAction.LIKE: _dispatch_duplicate_like,
-    TurnAction.COMMENT: _dispatch_duplicate_comment,
-    TurnAction.FOLLOW: _dispatch_duplicate_follow,
-}
-
-_HISTORY_DISPATCH: dict[TurnAction, _HistoryValidator] = {
-    TurnAction.LIKE: _dispatch_history_like,
-    TurnAction.COMMENT: _dispatch_history_comment,
-    TurnAction.FOLLOW: _dispatch_history_follow,
-}
-
-
 class AgentActionRulesValidator:
     """Strict validator for generated agent action rules."""
 
@@ -158,7 +65,7 @@ class AgentActionRulesValidator:
         """Enforce per-author caps and duplicate ``turn_post_id`` within a turn."""
         if not posts:
             return
-        duplicate_ids = self._find_duplicates([p.turn_post_id for p in posts])
+        _, duplicate_ids = _collect_target_ids(p.turn_post_id for p in posts)
         if duplicate_ids:
             raise ValueError(
                 f"Duplicate turn_post_id values in run {run_id}, turn {turn_number}: "
@@ -186,28 +93,60 @@ class AgentActionRulesValidator:
         action_history_store: ActionHistoryStore,
     ) -> tuple[list[str], list[str], list[str]]:
         """Validate action invariants and return extracted target identifiers."""
-        like_post_ids = [like.like.post_id for like in likes]
-        comment_post_ids = [comment.comment.post_id for comment in comments]
-        follow_target_agent_ids = [follow.follow.target_agent_id for follow in follows]
+        if not likes and not comments and not follows:
+            return [], [], []
 
-        self.validate_duplicates(
+        # Extract target IDs and detect in-turn duplicates.
+        like_post_ids, duplicate_like_targets = _collect_target_ids(
+            map(_like_post_id, likes)
+        )
+        self._validate_duplicate_likes(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            like_post_ids=like_post_ids,
-            comment_post_ids=comment_post_ids,
-            follow_target_agent_ids=follow_target_agent_ids,
+            duplicate_like_targets=duplicate_like_targets,
+        )
+        comment_post_ids, duplicate_comment_targets = _collect_target_ids(
+            map(_comment_post_id, comments)
+        )
+        self._validate_duplicate_comments(
+            run_id=run_id,
+            turn_number=turn_number,
+            agent_handle=agent_handle,
+            duplicate_comment_targets=duplicate_comment_targets,
+        )
+        follow_target_agent_ids, duplicate_follow_targets = _collect_target_ids(
+            map(_follow_target_agent_id, follows)
+        )
+        self._validate_duplicate_follows(
+            run_id=run_id,
+            turn_number=turn_number,
+            agent_handle=agent_handle,
+            duplicate_follow_targets=duplicate_follow_targets,
         )
 
-        self.validate_previously_acted_on(
+        # One store lookup per agent; per-action checks are set operations.
+        action_targets = action_history_store.get_action_targets(run_id, agent_id)
+        self._validate_previously_liked(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            agent_id=agent_id,
             like_post_ids=like_post_ids,
+            action_targets=action_targets,
+        )
+        self._validate_previously_commented(
+            run_id=run_id,
+            turn_number=turn_number,
+            agent_handle=agent_handle,
             comment_post_ids=comment_post_ids,
+            action_targets=action_targets,
+        )
+        self._validate_previously_followed(
+            run_id=run_id,
+            turn_number=turn_number,
+            agent_handle=agent_handle,
             follow_target_agent_ids=follow_target_agent_ids,
-            action_history_store=action_history_store,
+            action_targets=action_targets,
         )
 
         return like_post_ids, comment_post_ids, follow_target_agent_ids
@@ -222,26 +161,23 @@ class AgentActionRulesValidator:
         comment_post_ids: list[str],
         follow_target_agent_ids: list[str],
     ) -> None:
-        self._validate_duplicates(
-            action_type=TurnAction.LIKE,
+        self._validate_duplicate_likes(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            identifiers=like_post_ids,
+            duplicate_like_targets=_collect_target_ids(like_post_ids)[1],
         )
-        self._validate_duplicates(
-            action_type=TurnAction.COMMENT,
+        self._validate_duplicate_comments(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            identifiers=comment_post_ids,
+            duplicate_comment_targets=_collect_target_ids(comment_post_ids)[1],
         )
-        self._validate_duplicates(
-            action_type=TurnAction.FOLLOW,
+        self._validate_duplicate_follows(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            identifiers=follow_target_agent_ids,
+            duplicate_follow_targets=_collect_target_ids(follow_target_agent_ids)[1],
         )
 
     def validate_previously_acted_on(
@@ -256,74 +192,27 @@ class AgentActionRulesValidator:
         follow_target_agent_ids: list[str],
         action_history_store: ActionHistoryStore,
     ) -> None:
-        self._validate_previously_acted_on(
-            action_type=TurnAction.LIKE,
+        action_targets = action_history_store.get_action_targets(run_id, agent_id)
+        self._validate_previously_liked(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            agent_id=agent_id,
-            identifiers=like_post_ids,
-            action_history_store=action_history_store,
+            like_post_ids=like_post_ids,
+            action_targets=action_targets,
         )
-        self._validate_previously_acted_on(
-            action_type=TurnAction.COMMENT,
+        self._validate_previously_commented(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            agent_id=agent_id,
-            identifiers=comment_post_ids,
-            action_history_store=action_history_store,
+            comment_post_ids=comment_post_ids,
+            action_targets=action_targets,
         )
-        self._validate_previously_acted_on(
-            action_type=TurnAction.FOLLOW,
+        self._validate_previously_followed(
             run_id=run_id,
             turn_number=turn_number,
             agent_handle=agent_handle,
-            agent_id=agent_id,
-            identifiers=follow_target_agent_ids,
-            action_history_store=action_history_store,
-        )
-
-    def _validate_duplicates(
-        self,
-        *,
-        action_type: TurnAction,
-        run_id: str,
-        turn_number: int,
-        agent_handle: str,
-        identifiers: list[str],
-    ) -> None:
-        validator_fn = _DUPLICATE_DISPATCH.get(action_type)
-        if validator_fn is None:
-            raise ValueError(
-                f"Unknown action_type for duplicate validation: {action_type}"
-            )
-        validator_fn(self, run_id, turn_number, agent_handle, identifiers)
-
-    def _validate_previously_acted_on(
-        self,
-        *,
-        action_type: TurnAction,
-        run_id: str,
-        turn_number: int,
-        agent_handle: str,
-        agent_id: str,
-        identifiers: list[str],
-        action_history_store: ActionHistoryStore,
-    ) -> None:
-        validator_fn = _HISTORY_DISPATCH.get(action_type)
-        if validator_fn is None:
-            raise ValueError(
-                f"Unknown action_type for history validation: {action_type}"
-            )
-        validator_fn(
-            self,
-            run_id,
-            turn_number,
-            agent_handle,
-            agent_id,
-            identifiers,
-            action_history_store,
+            follow_target_agent_ids=follow_target_agent_ids,
+            action_targets=action_targets,
         )
 
     def _validate_duplicate_likes(
@@ -332,9 +221,8 @@ class AgentActionRulesValidator:
         run_id: str,
         turn_number: int,
         agent_handle: str,
-        like_post_ids: list[str],
+        duplicate_like_targets: list[str],
     ) -> None:
-        duplicate_like_targets = self._find_duplicates(like_post_ids)
         if duplicate_like_targets:
             raise ValueError(
                 f"Agent {agent_handle} liked duplicate targets in run {run_id}, "
@@ -347,9 +235,8 @@ class AgentActionRulesValidator:
         run_id: str,
         turn_number: int,
         agent_handle: str,
-        comment_post_ids: list[str],
+        duplicate_comment_targets: list[str],
     ) -> None:
-        duplicate_comment_targets = self._find_duplicates(comment_post_ids)
         if duplicate_comment_targets:
             raise ValueError(
                 f"Agent {agent_handle} commented duplicate targets in run {run_id}, "
@@ -362,9 +249,8 @@ class AgentActionRulesValidator:
         run_id: str,
         turn_number: int,
         agent_handle: str,
-        follow_target_agent_ids: list[str],
+        duplicate_follow_targets: list[str],
     ) -> None:
-        duplicate_follow_targets = self._find_duplicates(follow_target_agent_ids)
         if duplicate_follow_targets:
             raise ValueError(
                 f"Agent {agent_handle} followed duplicate targets in run {run_id}, "
@@ -377,16 +263,17 @@ class AgentActionRulesValidator:
         run_id: str,
         turn_number: int,
         agent_handle: str,
-        agent_id: str,
         like_post_ids: list[str],
-        action_history_store: ActionHistoryStore,
+        action_targets: AgentActionTargets,
     ) -> None:
-        for post_id in like_post_ids:
-            if action_history_store.has_liked(run_id, agent_id, post_id):
-                raise ValueError(
-                    f"Agent {agent_handle} cannot like post {post_id} again in run {run_id}, "
-                    f"turn {turn_number}"
-                )
+        repeated = _first_previously_targeted(
+            like_post_ids, action_targets.liked_post_ids
+        )
+        if repeated is not None:
+            raise ValueError(
+                f"Agent {agent_handle} cannot like post {repeated} again in run {run_id}, "
+                f"turn {turn_number}"
+            )
 
     def _validate_previously_commented(
         self,
@@ -394,16 +281,17 @@ class AgentActionRulesValidator:
         run_id: str,
         turn_number: int,
         agent_handle: str,
-        agent_id: str,
         comment_post_ids: list[str],
-        action_history_store: ActionHistoryStore,
+        action_targets: AgentActionTargets,
     ) -> None:
-        for post_id in comment_post_ids:
-            if action_history_store.has_commented(run_id, agent_id, post_id):
-                raise ValueError(
-                    f"Agent {agent_handle} cannot comment on post {post_id} again in run {run_id}, "
-                    f"turn {turn_number}"
-                )
+        repeated = _first_previously_targeted(
+            comment_post_ids, action_targets.commented_post_ids
+        )
+        if repeated is not None:
+            raise ValueError(
+                f"Agent {agent_handle} cannot comment on post {repeated} again in run {run_id}, "
+                f"turn {turn_number}"
+            )
 
     def _validate_previously_followed(
         self,
@@ -411,17 +299,14 @@ class AgentActionRulesValidator:
         run_id: str,
         turn_number: int,
         agent_handle: str,
-        agent_id: str,
         follow_target_agent_ids: list[str],
-        action_history_store: ActionHistoryStore,
+        action_targets: AgentActionTargets,
     ) -> None:
-        for target_agent_id in follow_target_agent_ids:
-            if action_history_store.has_followed(run_id, agent_id, target_agent_id):
-                raise ValueError(
-                    f"Agent {agent_handle} cannot follow target {target_agent_id} again in run {run_id}, "
-                    f"turn {turn_number}"
-                )
-
-    def _find_duplicates(self, identifiers: list[str]) -> list[str]:
-        counter = Counter(identifiers)
-        return [identifier for identifier, count in counter.items() if count > 1]
+        repeated = _first_previously_targeted(
+            follow_target_agent_ids, action_targets.followed_agent_ids
+        )
+        if repeated is not None:
+            raise ValueError(
+                f"Agent {agent_handle} cannot follow target {repeated} again in run {run_id}, "
+                f"turn {turn_number}"
+            )
@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Callable, Iterable
 
 from db.repositories.interfaces import (
@@ -38,17 +39,34 @@ from simulation.core.utils.feed_visible_post_hydration import (
     ordered_posts_from_hydration,
 )
 
+TURN_KEYS_CACHE_SIZE: int = 64
+
+# Runs in these states take no further turns, so their history is released.
+_TERMINAL_RUN_STATUSES: frozenset[RunStatus] = frozenset(
+    {RunStatus.COMPLETED, RunStatus.FAILED}
+)
+
 
 def _get_turn_keys(run_config: RunConfig) -> list[str]:
     """Resolve metric keys from run config and return turn-scoped keys."""
     config_metric_keys = getattr(run_config, "metric_keys", None)
-    metric_keys: list[str] = (
-        config_metric_keys
-        if config_metric_keys and len(config_metric_keys) > 0
-        else get_default_metric_keys()
+    return list(
+        _resolve_turn_keys(tuple(config_metric_keys) if config_metric_keys else None)
     )
-    turn_keys, _ = resolve_metric_keys_by_scope(metric_keys)
-    return turn_keys
+
+
+@functools.lru_cache(maxsize=TURN_KEYS_CACHE_SIZE)
+def _resolve_turn_keys(metric_keys: tuple[str, ...] | None) -> tuple[str, ...]:
+    """Resolve turn-scoped keys once per distinct metric-key tuple.
+
+    ``None`` selects the default metric keys. Invalid keys raise and are not
+    cached, so they fail again on the next call.
+    """
+    keys: list[str] = (
+        list(metric_keys) if metric_keys is not None else get_default_metric_keys()
+    )
+    turn_keys, _ = resolve_metric_keys_by_scope(keys)
+    return tuple(turn_keys)
 
 
 class SimulationEngine:
@@ -89,6 +107,9 @@ class SimulationEngine:
         self.run_follow_edge_repo = run_follow_edge_repo
         self.agent_factory = agent_factory
         self.action_history_store_factory = action_history_store_factory
+        # One store per active run, so history accumulates across turn-by-turn
+        # calls; it is released once the run's execution ends or fails.
+        self._action_history_stores: dict[str, ActionHistoryStore] = {}
         self.run_post_like_repo = run_post_like_repo
         self.run_post_comment_repo = run_post_comment_repo
         self.query_service = query_service
@@ -153,8 +174,22 @@ class SimulationEngine:
         )
         return ordered_posts_from_hydration(post_ids_list, mapping)
 
+    def _action_history_store_for_run(self, run_id: str) -> ActionHistoryStore:
+        store = self._action_history_stores.get(run_id)
+        if store is None:
+            store = self.action_history_store_factory()
+            self._action_history_stores[run_id] = store
+        return store
+
+    def _release_action_history_store(self, run_id: str) -> None:
+        self._action_history_stores.pop(run_id, None)
+
     def update_run_status(self, run: Run, status: RunStatus) -> None:
-        self.command_service.update_run_status(run, status)
+        try:
+            self.command_service.update_run_status(run, status)
+        finally:
+            if status in _TERMINAL_RUN_STATUSES:
+                self._release_action_history_store(run.run_id)
 
     def simulate_turn(
         self,
@@ -164,14 +199,21 @@ class SimulationEngine:
         agents: list[SimulationAgent],
     ) -> None:
         turn_keys = _get_turn_keys(run_config)
-        self.command_service.simulate_turn(
-            run,
-            run_config,
-            turn_number,
-            agents,
-            action_history_store=self.action_history_store_factory(),
-            turn_metric_keys=turn_keys,
-        )
+        turn_succeeded = False
+        try:
+            self.command_service.simulate_turn(
+                run,
+                run_config,
+                turn_number,
+                agents,
+                action_history_store=self._action_history_store_for_run(run.run_id),
+                turn_metric_keys=turn_keys,
+            )
+            turn_succeeded = True
+        finally:
+            # A failed turn or the run's last turn ends its execution.
+            if not turn_succeeded or turn_number >= run.total_turns - 1:
+                self._release_action_history_store(run.run_id)
 
     def simulate_turns(
         self,
@@ -181,14 +223,17 @@ class SimulationEngine:
         agents: list[SimulationAgent],
     ) -> None:
         turn_keys = _get_turn_keys(run_config)
-        self.command_service.simulate_turns(
-            total_turns,
-            run,
-            run_config,
-            agents,
-            action_history_store=self.action_history_store_factory(),
-            turn_metric_keys=turn_keys,
-        )
+        try:
+            self.command_service.simulate_turns(
+                total_turns,
+                run,
+                run_config,
+                agents,
+                action_history_store=self._action_history_store_for_run(run.run_id),
+                turn_metric_keys=turn_keys,
+            )
+        finally:
+            self._release_action_history_store(run.run_id)
 
     def create_agents_for_run(
         self,
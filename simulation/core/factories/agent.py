@@ -1,6 +1,7 @@
 """Factory helpers for constructing runtime simulation agents."""
 
 from collections.abc import Callable
+from itertools import islice
 
 from db.repositories.interfaces import (
     AgentBioRepository,
@@ -56,17 +57,15 @@ def create_default_agent_factory(
             InsufficientAgentsError: If no agents are available or fewer than
                 requested are available.
         """
-        # Create all available agents
-        all_agents = _create_simulation_agents_from_seed_state(
+        # Build only the first num_agents seed agents
+        agents = _create_simulation_agents_from_seed_state(
             agent_repo=agent_repo,
             agent_bio_repo=agent_bio_repo,
             user_agent_profile_metadata_repo=user_agent_profile_metadata_repo,
             feed_post_repo=feed_post_repo,
+            limit=num_agents,
         )
 
-        # Apply limit
-        agents = all_agents[:num_agents]
-
         # Validate agents
         validate_insufficient_agents(agents=agents, requested_agents=num_agents)
         validate_duplicate_agent_handles(agents=agents)
@@ -82,8 +81,13 @@ def _create_simulation_agents_from_seed_state(
     agent_bio_repo: AgentBioRepository,
     user_agent_profile_metadata_repo: UserAgentProfileMetadataRepository,
     feed_post_repo: FeedPostRepository,
+    limit: int | None = None,
 ) -> list[SimulationAgent]:
-    """Hydrate runtime simulation agents from the current seed-state catalog."""
+    """Hydrate runtime simulation agents from the current seed-state catalog.
+
+    When ``limit`` is given, only the first ``limit`` seed agents (in catalog
+    order) are built; the rest are never materialized.
+    """
     seed_state = hydrate_seed_state(
         agent_repo=agent_repo,
         agent_bio_repo=agent_bio_repo,
@@ -102,7 +106,7 @@ def _create_simulation_agents_from_seed_state(
 
     # Build agents from seed state so later run snapshots can FK back to
     # the selected `agent.agent_id` rows.
-    for agent_record in agent_records:
+    for agent_record in islice(agent_records, limit):
         latest_bio = latest_bios.get(agent_record.agent_id)
         if latest_bio is None:
             raise ValueError(
@@ -3,7 +3,6 @@
 from collections.abc import Callable
 
 from db.services.simulation_persistence_service import SimulationPersistenceService
-from feeds.feed_generator_adapter import FeedGeneratorAdapter
 from feeds.interfaces import FeedGenerator
 from simulation.core.action_history import (
     ActionHistoryStore,
@@ -29,8 +28,20 @@ from simulation.core.services.command_service_bundles import (
     CommandServiceRuntime,
 )
 
+# Stateless policy defaults; one shared instance serves every command service.
+_DEFAULT_AGENT_ACTION_RULES_VALIDATOR = AgentActionRulesValidator()
+_DEFAULT_AGENT_ACTION_FEED_FILTER: AgentActionFeedFilter = (
+    HistoryAwareActionFeedFilter()
+)
+# MetricsRegistry exposes no mutators, so the built-in catalog is shared too.
+_DEFAULT_METRICS_REGISTRY: MetricsRegistry = create_default_metrics_registry()
+
 
 def _default_feed_generator(repos: CommandServiceRepos) -> FeedGenerator:
+    # Imported here so callers that inject a feed generator never load the
+    # feed-generation/algorithm subtree.
+    from feeds.feed_generator_adapter import FeedGeneratorAdapter
+
     return FeedGeneratorAdapter(
         generated_feed_repo=repos.turn.generated_feed_repo,
         run_post_repo=repos.run.run_post_repo,
@@ -41,14 +52,13 @@ def _default_feed_generator(repos: CommandServiceRepos) -> FeedGenerator:
 
 
 def _default_metrics_collector(repos: CommandServiceRepos) -> MetricsCollector:
-    registry: MetricsRegistry = create_default_metrics_registry()
     deps = MetricDeps(
         run_repo=repos.run.run_repo,
         metrics_repo=repos.run.metrics_repo,
         sql_executor=None,
     )
     return MetricsCollector(
-        registry=registry,
+        registry=_DEFAULT_METRICS_REGISTRY,
         turn_metric_keys=DEFAULT_TURN_METRIC_KEYS,
         run_metric_keys=DEFAULT_RUN_METRIC_KEYS,
         deps=deps,
@@ -84,8 +94,8 @@ def create_command_service(
             action_history_store_factory=action_history_store_factory,
             feed_generator=feed_generator,
             agent_action_rules_validator=agent_action_rules_validator
-            or AgentActionRulesValidator(),
+            or _DEFAULT_AGENT_ACTION_RULES_VALIDATOR,
             agent_action_feed_filter=agent_action_feed_filter
-            or HistoryAwareActionFeedFilter(),
+            or _DEFAULT_AGENT_ACTION_FEED_FILTER,
         ),
     )
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import cast
+
 from pydantic import TypeAdapter
 
 from simulation.core.metrics.interfaces import (
@@ -13,10 +17,28 @@ from simulation.core.models.actions import TurnAction
 from simulation.core.models.metrics import ComputedMetricResult, ComputedMetrics
 from simulation.core.utils.validators import validate_run_exists
 
-TURN_ACTION_COUNTS_BY_TYPE_ADAPTER = TypeAdapter(dict[str, int])
-TURN_ACTION_TOTAL_ADAPTER = TypeAdapter(int)
-RUN_ACTION_TOTALS_BY_TYPE_ADAPTER = TypeAdapter(dict[str, int])
-RUN_ACTION_TOTAL_ADAPTER = TypeAdapter(int)
+# Turn and run metrics share output shapes, so each core schema is built once.
+_ACTION_COUNTS_ADAPTER = TypeAdapter(dict[str, int])
+_ACTION_TOTAL_ADAPTER = TypeAdapter(int)
+
+TURN_ACTION_COUNTS_BY_TYPE_ADAPTER = _ACTION_COUNTS_ADAPTER
+TURN_ACTION_TOTAL_ADAPTER = _ACTION_TOTAL_ADAPTER
+RUN_ACTION_TOTALS_BY_TYPE_ADAPTER = _ACTION_COUNTS_ADAPTER
+RUN_ACTION_TOTAL_ADAPTER = _ACTION_TOTAL_ADAPTER
+
+# TurnAction is fixed at import time, so the output key order is sorted once.
+_ACTIONS_BY_VALUE: tuple[TurnAction, ...] = tuple(
+    sorted(TurnAction, key=attrgetter("value"))
+)
+
+
+def _counts_by_action_value(
+    totals: Mapping[TurnAction, int],
+) -> dict[str, ComputedMetricResult]:
+    """Return ``{action.value: count}`` in action-value order, skipping absent actions."""
+    return {
+        action.value: totals[action] for action in _ACTIONS_BY_VALUE if action in totals
+    }
 
 
 class TurnActionCountsByTypeMetric(Metric):
@@ -42,8 +64,7 @@ class TurnActionCountsByTypeMetric(Metric):
                 f"Missing turn metadata for run_id={ctx.run_id}, turn_number={ctx.turn_number}"
             )
 
-        ordered = sorted(metadata.total_actions.items(), key=lambda item: item[0].value)
-        return {action.value: count for action, count in ordered}
+        return _counts_by_action_value(metadata.total_actions)
 
 
 class TurnActionTotalMetric(Metric):
@@ -67,27 +88,16 @@ class TurnActionTotalMetric(Metric):
         counts = prior.get("turn.actions.counts_by_type", {})
         if not isinstance(counts, dict):
             raise ValueError("turn.actions.counts_by_type must be an object")
-        counts_obj: dict[str, ComputedMetricResult] = counts
-        total = 0
-        for key, value in counts_obj.items():
-            if not isinstance(value, int):
-                raise ValueError(
-                    "turn.actions.counts_by_type must contain integer values "
-                    f"(got {type(value).__name__} for key '{key}')"
-                )
-            total += value
-        return total
+        # The collector strict-validates turn.actions.counts_by_type as dict[str, int]
+        # before dependents run, so the values need no per-item check.
+        return sum(cast(dict[str, int], counts).values())
 
 
 class RunActionTotalsByTypeMetric(Metric):
     """Aggregated action counts across all turns, by type.
 
-    Limitation (revisit later): compute() uses deps.run_repo.list_turn_metadata,
-    which loads all turn rows into memory. For large runs, consider replacing
-    with DB-side aggregation (e.g. run_repo.aggregate_action_totals(run_id)
-    returning dict[TurnAction, int], or MetricsSqlExecutor with a SQL GROUP BY
-    on turn metadata). Keep the same output shape (action.value -> count) and
-    retain validate_run_exists.
+    Summed in the database via deps.run_repo.aggregate_action_totals, so turn
+    rows are never hydrated into TurnMetadata.
     """
 
     KEY = "run.actions.total_by_type"
@@ -106,14 +116,9 @@ class RunActionTotalsByTypeMetric(Metric):
         run = deps.run_repo.get_run(ctx.run_id)
         validate_run_exists(run=run, run_id=ctx.run_id)
 
-        totals: dict[TurnAction, int] = {action: 0 for action in TurnAction}
-        metadata_list = deps.run_repo.list_turn_metadata(ctx.run_id)
-        for metadata in metadata_list:
-            for action, count in metadata.total_actions.items():
-                totals[action] = totals.get(action, 0) + count
-
-        ordered = sorted(totals.items(), key=lambda item: item[0].value)
-        return {action.value: count for action, count in ordered}
+        return _counts_by_action_value(
+            deps.run_repo.aggregate_action_totals(ctx.run_id)
+        )
 
 
 class RunActionTotalMetric(Metric):
@@ -137,13 +142,5 @@ class RunActionTotalMetric(Metric):
         totals = prior.get("run.actions.total_by_type", {})
         if not isinstance(totals, dict):
             raise ValueError("run.actions.total_by_type must be an object")
-        totals_obj: dict[str, ComputedMetricResult] = totals
-        total = 0
-        for key, value in totals_obj.items():
-            if not isinstance(value, int):
-                raise ValueError(
-                    "run.actions.total_by_type must contain integer values "
-                    f"(got {type(value).__name__} for key '{key}')"
-                )
-            total += value
-        return total
+        # Already strict-validated by the collector (see TurnActionTotalMetric).
+        return sum(cast(dict[str, int], totals).values())
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
+from collections.abc import Sequence
 
 from pydantic import TypeAdapter, ValidationError
 
@@ -24,13 +25,14 @@ class MetricsCollector:
         self,
         *,
         registry: MetricsRegistry,
-        turn_metric_keys: list[str],
-        run_metric_keys: list[str],
+        turn_metric_keys: Sequence[str],
+        run_metric_keys: Sequence[str],
         deps: MetricDeps,
     ):
         self._registry = registry
-        self._turn_metric_keys = list(turn_metric_keys)
-        self._run_metric_keys = list(run_metric_keys)
+        # tuple() returns tuple inputs (e.g. the shared defaults) without copying.
+        self._turn_metric_keys = tuple(turn_metric_keys)
+        self._run_metric_keys = tuple(run_metric_keys)
         self._deps = deps
 
     def collect_turn_metrics(
@@ -167,7 +169,7 @@ class MetricsCollector:
         while ready:
             key = ready.pop(0)
             ordered.append(key)
-            for dependent in sorted(required_by.get(key, set())):
+            for dependent in sorted(required_by.get(key, ())):
                 indegree[dependent] -= 1
                 if indegree[dependent] == 0:
                     ready.append(dependent)
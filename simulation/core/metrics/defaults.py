@@ -45,17 +45,17 @@ KEY_TO_SCOPE: dict[str, MetricScope] = {
     metric_cls.KEY: metric_cls.SCOPE for metric_cls in BUILTIN_METRICS
 }
 
-DEFAULT_TURN_METRIC_KEYS: list[str] = [
+DEFAULT_TURN_METRIC_KEYS: tuple[str, ...] = tuple(
     metric_cls.KEY
     for metric_cls in BUILTIN_METRICS
     if metric_cls.SCOPE == MetricScope.TURN and metric_cls.DEFAULT_ENABLED
-]
+)
 
-DEFAULT_RUN_METRIC_KEYS: list[str] = [
+DEFAULT_RUN_METRIC_KEYS: tuple[str, ...] = tuple(
     metric_cls.KEY
     for metric_cls in BUILTIN_METRICS
     if metric_cls.SCOPE == MetricScope.RUN and metric_cls.DEFAULT_ENABLED
-]
+)
 
 
 def get_default_metric_keys() -> list[str]:
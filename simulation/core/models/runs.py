@@ -19,6 +19,8 @@ class RunConfig(BaseModel):
     feed_algorithm: str
     feed_algorithm_config: dict[str, JsonValue] | None = None
     metric_keys: list[str] | None = None
+    # Max agents processed concurrently within a turn; 1 keeps turns sequential.
+    turn_parallelism: int = 1
 
     @field_validator("metric_keys")
     @classmethod
@@ -47,6 +49,11 @@ class RunConfig(BaseModel):
     def validate_feed_algorithm(cls, v: str) -> str:
         return validate_non_empty_string(v)
 
+    @field_validator("turn_parallelism")
+    @classmethod
+    def validate_turn_parallelism(cls, v: int) -> int:
+        return validate_nonnegative_value(v, "turn_parallelism", ok_equals_zero=False)
+
 
 class RunStatus(str, Enum):
     """
@@ -1,14 +1,22 @@
 import logging
+import time
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
 from uuid import uuid4
 
 from pydantic import JsonValue
 
 from db.services.simulation_persistence_service import SimulationPersistenceService
 from feeds.interfaces import FeedGenerationResult
-from lib.decorators import timed
+from lib.decorators import NS_PER_MS, timed
 from lib.timestamp_utils import get_current_timestamp
-from simulation.core.action_history import ActionHistoryStore, record_action_targets
+from simulation.core.action_history import (
+    ActionHistoryStore,
+    AgentActionTargetRecord,
+    record_turn_action_targets,
+)
 from simulation.core.agent_actions import (
     generate_comments,
     generate_follows,
@@ -25,6 +33,7 @@ from simulation.core.models.generated.comment import GeneratedComment
 from simulation.core.models.generated.follow import GeneratedFollow
 from simulation.core.models.generated.like import GeneratedLike
 from simulation.core.models.metrics import ComputedMetrics, RunMetrics, TurnMetrics
+from simulation.core.models.posts import Post
 from simulation.core.models.run_agents import RunAgentSnapshot
 from simulation.core.models.run_follow_edges import RunFollowEdgeSnapshot
 from simulation.core.models.run_post_comments import RunPostCommentSnapshot
@@ -51,6 +60,22 @@ logger = logging.getLogger(__name__)
 
 STATUS_UPDATE_MAX_ATTEMPTS: int = 3
 STATUS_UPDATE_BACKOFF_BASE: int = 2
+STATUS_UPDATE_MAX_BACKOFF_S: float = 4.0
+# Spread retries of concurrent runs contending for the same database.
+STATUS_UPDATE_BACKOFF_JITTER: float = 0.5
+
+
+@dataclass(frozen=True)
+class _AgentTurnActions:
+    """One agent's validated actions for a turn, pending history recording."""
+
+    agent_id: str
+    likes: list[GeneratedLike]
+    comments: list[GeneratedComment]
+    follows: list[GeneratedFollow]
+    like_post_ids: list[str]
+    comment_post_ids: list[str]
+    follow_target_agent_ids: list[str]
 
 
 class SimulationCommandService:
@@ -100,7 +125,10 @@ class SimulationCommandService:
             run = self.run_repo.create_run(
                 run_config, created_by_app_user_id=created_by_app_user_id
             )
-            self.update_run_status(run, RunStatus.RUNNING)
+            # create_run returns the freshly persisted run, so its status is
+            # authoritative here and a RUNNING run needs no second write.
+            if run.status != RunStatus.RUNNING:
+                self.update_run_status(run, RunStatus.RUNNING)
         except Exception as e:
             raise SimulationRunFailure(
                 message="Run creation or status update failed",
@@ -229,6 +257,8 @@ class SimulationCommandService:
                 retry_on=RunStatusUpdateError,
                 max_attempts=STATUS_UPDATE_MAX_ATTEMPTS,
                 backoff_base=STATUS_UPDATE_BACKOFF_BASE,
+                max_delay_s=STATUS_UPDATE_MAX_BACKOFF_S,
+                jitter=STATUS_UPDATE_BACKOFF_JITTER,
             )
         except RunStatusUpdateError as e:
             # Best-effort: if the requested status isn't terminal, attempt to
@@ -274,6 +304,7 @@ class SimulationCommandService:
                 action_history_store=action_history_store,
                 turn_metric_keys=turn_metric_keys,
                 feed_algorithm_config=feed_algorithm_config,
+                turn_parallelism=run_config.turn_parallelism,
             )
         except Exception as e:
             logger.error(
@@ -289,7 +320,7 @@ class SimulationCommandService:
                     "total_turns": run.total_turns,
                 },
             )
-            self.update_run_status(run, RunStatus.FAILED)
+            # Run status is owned by execute_run, which marks the run FAILED.
             raise RuntimeError(
                 f"Failed to complete turn {turn_number} for run {run.run_id}: {e}"
             ) from e
@@ -338,8 +369,10 @@ class SimulationCommandService:
         action_history_store: ActionHistoryStore,
         turn_metric_keys: list[str],
         feed_algorithm_config: Mapping[str, JsonValue] | None = None,
+        turn_parallelism: int = 1,
     ) -> TurnResult:
         """Simulate a single turn of the simulation."""
+        start_ns = time.perf_counter_ns()
         run_id: str = run.run_id
 
         feed_generation_result = self.feed_generator.generate_feeds(
@@ -359,91 +392,76 @@ class SimulationCommandService:
             agent_to_hydrated_feeds = feed_generation_result
             generated_feeds = []
 
+        # Look up each agent's feed once; the same pass counts missing feeds
+        # so the ratio check runs before any action generation, and keeps
+        # only agents with a non-empty feed (in agent order).
+        agents_with_feeds: list[tuple[SimulationAgent, list[Post]]] = []
+        num_agents_without_feeds = 0
+        get_feed = agent_to_hydrated_feeds.get
+        for agent in agents:
+            feed = get_feed(agent.handle)
+            if feed is None:
+                num_agents_without_feeds += 1
+            elif feed:
+                agents_with_feeds.append((agent, feed))
         validate_agents_without_feeds(
-            agent_handles=set(agent.handle for agent in agents),
-            agents_with_feeds=set(agent_to_hydrated_feeds.keys()),
+            num_agents=len(agents),
+            num_agents_without_feeds=num_agents_without_feeds,
         )
 
-        total_actions: dict[TurnAction, int] = {action: 0 for action in TurnAction}
-        turn_likes: list[GeneratedLike] = []
-        turn_comments: list[GeneratedComment] = []
-        turn_follows: list[GeneratedFollow] = []
-
-        for agent in agents:
-            feed = agent_to_hydrated_feeds.get(agent.handle, [])
-
-            if not feed:
-                continue
-
-            if agent.agent_id is None:
-                raise ValueError(
-                    f"SimulationAgent {agent.handle!r} must have agent_id set for action generation"
-                )
-
-            # Filter the feed into action-specific eligible candidates. For
-            # example, we don't want to allow an agent to like a post they've
-            # already liked, or comment on a post they've already commented on.
-            action_candidates = self.agent_action_feed_filter.filter_candidates(
+        def _generate_for_agent(
+            agent_and_feed: tuple[SimulationAgent, list[Post]],
+        ) -> _AgentTurnActions:
+            agent, feed = agent_and_feed
+            return self._generate_agent_turn_actions(
                 run_id=run_id,
-                agent_handle=agent.handle,
-                agent_id=agent.agent_id,
+                turn_number=turn_number,
+                agent=agent,
                 feed=feed,
                 action_history_store=action_history_store,
             )
 
-            # Generate the actions.
-            likes = generate_likes(
-                action_candidates.like_candidates,
-                run_id=run_id,
-                turn_number=turn_number,
-                agent_handle=agent.handle,
-                agent_id=agent.agent_id,
-            )
-            comments = generate_comments(
-                action_candidates.comment_candidates,
-                run_id=run_id,
-                turn_number=turn_number,
-                agent_handle=agent.handle,
-                agent_id=agent.agent_id,
-            )
-            follows = generate_follows(
-                action_candidates.follow_candidates,
-                run_id=run_id,
-                turn_number=turn_number,
-                agent_handle=agent.handle,
-                agent_id=agent.agent_id,
-            )
-
-            # Validate the action rules.
-            like_post_ids, comment_post_ids, follow_target_agent_ids = (
-                self.agent_action_rules_validator.validate(
-                    run_id=run_id,
-                    turn_number=turn_number,
-                    agent_handle=agent.handle,
-                    agent_id=agent.agent_id,
-                    likes=likes,
-                    comments=comments,
-                    follows=follows,
-                    action_history_store=action_history_store,
+        # Agents only read their own history while generating, so they can
+        # fan out; history is recorded afterwards, serially and in agent order.
+        if turn_parallelism > 1 and len(agents_with_feeds) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(agents_with_feeds), turn_parallelism)
+            ) as executor:
+                agent_turn_actions = list(
+                    executor.map(_generate_for_agent, agents_with_feeds)
                 )
+        else:
+            agent_turn_actions = [
+                _generate_for_agent(agent_and_feed)
+                for agent_and_feed in agents_with_feeds
+            ]
+
+        # Flatten per-agent chunks at C level; totals are the flattened lengths.
+        turn_likes: list[GeneratedLike] = list(
+            chain.from_iterable(actions.likes for actions in agent_turn_actions)
+        )
+        turn_comments: list[GeneratedComment] = list(
+            chain.from_iterable(actions.comments for actions in agent_turn_actions)
+        )
+        turn_follows: list[GeneratedFollow] = list(
+            chain.from_iterable(actions.follows for actions in agent_turn_actions)
+        )
+        turn_target_records: list[AgentActionTargetRecord] = [
+            AgentActionTargetRecord(
+                agent_id=actions.agent_id,
+                like_post_ids=actions.like_post_ids,
+                comment_post_ids=actions.comment_post_ids,
+                follow_target_agent_ids=actions.follow_target_agent_ids,
             )
+            for actions in agent_turn_actions
+        ]
 
-            # Record the action targets into action history.
-            record_action_targets(
-                run_id=run_id,
-                agent_id=agent.agent_id,
-                like_post_ids=like_post_ids,
-                comment_post_ids=comment_post_ids,
-                follow_target_agent_ids=follow_target_agent_ids,
-                action_history_store=action_history_store,
-            )
-
-            turn_likes.extend(likes)
-            turn_comments.extend(comments)
-            turn_follows.extend(follows)
-            total_actions[TurnAction.LIKE] += len(likes)
-            total_actions[TurnAction.COMMENT] += len(comments)
-            total_actions[TurnAction.FOLLOW] += len(follows)
+        # Record every agent's action targets into action history in one call.
+        record_turn_action_targets(
+            run_id=run_id,
+            records=turn_target_records,
+            action_history_store=action_history_store,
+        )
 
         created_at: str = get_current_timestamp()
 
@@ -458,7 +476,12 @@ class SimulationCommandService:
             turn_number=turn_number,
             posts=turn_post_snapshots,
         )
-        total_actions[TurnAction.POST] = len(turn_post_snapshots)
+        total_actions: dict[TurnAction, int] = {
+            TurnAction.LIKE: len(turn_likes),
+            TurnAction.COMMENT: len(turn_comments),
+            TurnAction.FOLLOW: len(turn_follows),
+            TurnAction.POST: len(turn_post_snapshots),
+        }
 
         turn_metadata = TurnMetadata(
             run_id=run_id,
@@ -492,7 +515,82 @@ class SimulationCommandService:
         return TurnResult(
             turn_number=turn_number,
             total_actions=total_actions,
-            execution_time_ms=None,
+            execution_time_ms=(time.perf_counter_ns() - start_ns) // NS_PER_MS,
+        )
+
+    def _generate_agent_turn_actions(
+        self,
+        *,
+        run_id: str,
+        turn_number: int,
+        agent: SimulationAgent,
+        feed: list[Post],
+        action_history_store: ActionHistoryStore,
+    ) -> _AgentTurnActions:
+        """Filter, generate, and validate one agent's actions without recording them."""
+        agent_handle = agent.handle
+        agent_id = agent.agent_id
+        if agent_id is None:
+            raise ValueError(
+                f"SimulationAgent {agent_handle!r} must have agent_id set for action generation"
+            )
+
+        # Filter the feed into action-specific eligible candidates. For
+        # example, we don't want to allow an agent to like a post they've
+        # already liked, or comment on a post they've already commented on.
+        action_candidates = self.agent_action_feed_filter.filter_candidates(
+            run_id=run_id,
+            agent_handle=agent_handle,
+            agent_id=agent_id,
+            feed=feed,
+            action_history_store=action_history_store,
+        )
+
+        # Generate the actions.
+        likes = generate_likes(
+            action_candidates.like_candidates,
+            run_id=run_id,
+            turn_number=turn_number,
+            agent_handle=agent_handle,
+            agent_id=agent_id,
+        )
+        comments = generate_comments(
+            action_candidates.comment_candidates,
+            run_id=run_id,
+            turn_number=turn_number,
+            agent_handle=agent_handle,
+            agent_id=agent_id,
+        )
+        follows = generate_follows(
+            action_candidates.follow_candidates,
+            run_id=run_id,
+            turn_number=turn_number,
+            agent_handle=agent_handle,
+            agent_id=agent_id,
+        )
+
+        # Validate the action rules.
+        like_post_ids, comment_post_ids, follow_target_agent_ids = (
+            self.agent_action_rules_validator.validate(
+                run_id=run_id,
+                turn_number=turn_number,
+                agent_handle=agent_handle,
+                agent_id=agent_id,
+                likes=likes,
+                comments=comments,
+                follows=follows,
+                action_history_store=action_history_store,
+            )
+        )
+
+        return _AgentTurnActions(
+            agent_id=agent_id,
+            likes=likes,
+            comments=comments,
+            follows=follows,
+            like_post_ids=like_post_ids,
+            comment_post_ids=comment_post_ids,
+            follow_target_agent_ids=follow_target_agent_ids,
         )
 
     def _create_agents_for_run(
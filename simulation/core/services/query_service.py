@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from itertools import chain
 
 from db.repositories.interfaces import (
     CommentRepository,
@@ -31,6 +32,7 @@ from simulation.core.models.turns import TurnData, TurnMetadata
 from simulation.core.utils.exceptions import RunNotFoundError
 from simulation.core.utils.feed_visible_post_hydration import (
     hydrate_feed_visible_posts_for_run,
+    ordered_posts_from_hydration,
 )
 from simulation.core.utils.turn_data_hydration import (
     persisted_comment_to_generated,
@@ -160,36 +162,28 @@ class SimulationQueryService:
         ):
             return None
 
-        post_ids_set: set[str] = set()
-        for feed in feeds:
-            post_ids_set.update(feed.post_ids)
-        for row in like_rows:
-            post_ids_set.add(row.post_id)
-        for row in comment_rows:
-            post_ids_set.add(row.post_id)
-        for tp in turn_post_rows:
-            post_ids_set.add(tp.turn_post_id)
-
-        post_ids_list = list(post_ids_set)
+        # Built in one set display; the hydration helper accepts any iterable,
+        # so the set is passed through without an intermediate list.
+        post_ids_set: set[str] = {
+            *chain.from_iterable(feed.post_ids for feed in feeds),
+            *(row.post_id for row in like_rows),
+            *(row.post_id for row in comment_rows),
+            *(tp.turn_post_id for tp in turn_post_rows),
+        }
         post_id_to_post = hydrate_feed_visible_posts_for_run(
             run_id,
-            post_ids_list,
+            post_ids_set,
             run_post_repo=self.run_post_repo,
             turn_post_repo=self.turn_post_repo,
             run_post_like_repo=self.run_post_like_repo,
             run_post_comment_repo=self.run_post_comment_repo,
         )
 
-        feeds_dict: dict[str, list[Post]] = {}
-        feed_records: dict[str, GeneratedFeed] = {}
-        for feed in feeds:
-            hydrated_posts: list[Post] = []
-            for post_id in feed.post_ids:
-                if post_id in post_id_to_post:
-                    hydrated_posts.append(post_id_to_post[post_id])
-            agent_key = feed.agent_id
-            feeds_dict[agent_key] = hydrated_posts
-            feed_records[agent_key] = feed
+        feeds_dict: dict[str, list[Post]] = {
+            feed.agent_id: ordered_posts_from_hydration(feed.post_ids, post_id_to_post)
+            for feed in feeds
+        }
+        feed_records: dict[str, GeneratedFeed] = {feed.agent_id: feed for feed in feeds}
 
         actions_by_agent: dict[
             str,
@@ -1,5 +1,9 @@
 """Domain-specific exceptions for the simulation engine."""
 
+from collections.abc import Set
+
+_EMPTY_TURN_NUMBERS: frozenset[int] = frozenset()
+
 
 class SimulationError(Exception):
     """
@@ -174,11 +178,15 @@ class InconsistentTurnDataError(ValueError):
         self,
         message: str,
         *,
-        metadata_only: set[int] | None = None,
-        metrics_only: set[int] | None = None,
+        metadata_only: Set[int] | None = None,
+        metrics_only: Set[int] | None = None,
     ):
-        self.metadata_only = metadata_only or set()
-        self.metrics_only = metrics_only or set()
+        self.metadata_only: Set[int] = (
+            metadata_only if metadata_only is not None else _EMPTY_TURN_NUMBERS
+        )
+        self.metrics_only: Set[int] = (
+            metrics_only if metrics_only is not None else _EMPTY_TURN_NUMBERS
+        )
         super().__init__(message)
 
 
@@ -72,4 +72,6 @@ def ordered_posts_from_hydration(
     post_ids: Iterable[str], mapping: dict[str, Post]
 ) -> list[Post]:
     """Preserve caller order; skip IDs not present in ``mapping``."""
-    return [mapping[pid] for pid in post_ids if pid in mapping]
+    # One ``dict.get`` per ID instead of a membership test plus a lookup.
+    get_post = mapping.get
+    return [post for pid in post_ids if (post := get_post(pid)) is not None]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import random
 import time
 from collections.abc import Callable
 from typing import TypeVar
@@ -13,12 +14,21 @@ def retry_with_exponential_backoff(
     retry_on: type[BaseException] | tuple[type[BaseException], ...],
     max_attempts: int,
     backoff_base: float,
+    max_delay_s: float | None = None,
+    jitter: float = 0.0,
 ) -> T:
     """
     Retry `operation` up to `max_attempts` using exponential backoff.
+
+    The delay before retry ``n`` is ``backoff_base**n``, capped at
+    ``max_delay_s`` when given. A non-zero ``jitter`` scales each delay by a
+    random factor in ``[1 - jitter, 1 + jitter]`` so concurrent callers do not
+    retry in lockstep.
     """
     if max_attempts < 1:
         raise ValueError("max_attempts must be >= 1")
+    if not 0.0 <= jitter <= 1.0:
+        raise ValueError("jitter must be between 0 and 1")
 
     last_exc: BaseException | None = None
     for attempt in range(max_attempts):
@@ -29,8 +39,11 @@ def retry_with_exponential_backoff(
             if attempt >= max_attempts - 1:
                 raise
 
-            # Mirror existing behavior: sleep uses backoff_base**attempt.
             delay_s = backoff_base**attempt
+            if max_delay_s is not None:
+                delay_s = min(delay_s, max_delay_s)
+            if jitter:
+                delay_s *= random.uniform(1.0 - jitter, 1.0 + jitter)
             time.sleep(delay_s)
 
     # Defensive: the loop always returns or raises.
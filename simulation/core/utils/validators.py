@@ -1,5 +1,6 @@
 from collections.abc import Iterable
 
+from lib.agent_id import is_canonical_agent_id
 from lib.validation_utils import (
     validate_non_empty_iterable,
     validate_non_empty_string,
@@ -58,8 +59,6 @@ def validate_canonical_agent_id(agent_id: str) -> str:
     Returns stripped value. Use for GeneratedFeed and repository boundaries
     that must reject handles or malformed IDs.
     """
-    from lib.agent_id import is_canonical_agent_id
-
     stripped = _validate_non_empty_string_labeled(agent_id, label="agent_id")
     if not is_canonical_agent_id(stripped):
         raise ValueError(
@@ -123,14 +122,13 @@ def validate_run_exists(run: Run | None, run_id: str) -> Run:
 
 
 def validate_agents_without_feeds(
-    agent_handles: set[str],
-    agents_with_feeds: set[str],
+    num_agents: int,
+    num_agents_without_feeds: int,
 ):
     """Validate that the number of empty feeds is not too high."""
-    agents_without_feeds = agent_handles - agents_with_feeds
-    if len(agents_without_feeds) / len(agent_handles) > MAX_RATIO_OF_EMPTY_FEEDS:
+    if num_agents_without_feeds / num_agents > MAX_RATIO_OF_EMPTY_FEEDS:
         raise ValueError(
-            f"Too many empty feeds: {len(agents_without_feeds)}/{len(agent_handles)}. "
+            f"Too many empty feeds: {num_agents_without_feeds}/{num_agents}. "
             f"This is greater than the maximum ratio of empty feeds: {MAX_RATIO_OF_EMPTY_FEEDS}. "
             "All feeds must be non-empty."
         )
@@ -152,11 +150,17 @@ def validate_handle_exists(handle: str) -> str:
 
 def validate_duplicate_agent_handles(agents: list[SimulationAgent]):
     """Validate that the agent handles are unique."""
-    handles = [agent.handle for agent in agents]
-    if len(handles) != len(set(handles)):
-        duplicates = [h for h in handles if handles.count(h) > 1]
+    seen: set[str] = set()
+    duplicates: set[str] = set()
+    for agent in agents:
+        handle = agent.handle
+        if handle in seen:
+            duplicates.add(handle)
+        else:
+            seen.add(handle)
+    if duplicates:
         raise ValueError(
-            f"Duplicate agent handles found: {set(duplicates)}. "
+            f"Duplicate agent handles found: {duplicates}. "
             "All agent handles must be unique."
         )
 
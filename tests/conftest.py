@@ -162,7 +162,7 @@ def temp_db(monkeypatch: pytest.MonkeyPatch) -> Generator[str, None, None]:
     - Creates a temp .sqlite file path
     - Ensures all SQLite consumers point at it (DB_PATH + SIM_DB_PATH)
     - Applies Alembic migrations via initialize_database()
-    - Deletes the file on teardown
+    - Deletes the file (and WAL sidecar files) on teardown
     """
     fd, temp_path = tempfile.mkstemp(suffix=".sqlite")
     os.close(fd)
@@ -178,5 +178,7 @@ def temp_db(monkeypatch: pytest.MonkeyPatch) -> Generator[str, None, None]:
     try:
         yield temp_path
     finally:
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+        # WAL journaling leaves -wal/-shm sidecar files next to the database.
+        for path in (temp_path, f"{temp_path}-wal", f"{temp_path}-shm"):
+            if os.path.exists(path):
+                os.unlink(path)
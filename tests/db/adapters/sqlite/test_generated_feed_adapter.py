@@ -29,6 +29,40 @@ def default_test_data():
     }
 
 
+class TestSQLiteGeneratedFeedAdapterWriteGeneratedFeeds:
+    """Tests for SQLiteGeneratedFeedAdapter.write_generated_feeds method."""
+
+    def test_writes_all_feeds_with_one_executemany(self, adapter):
+        """Test that every feed becomes one row of a single executemany call."""
+        # Arrange
+        feeds = [
+            GeneratedFeed(
+                feed_id=f"feed_{i}",
+                run_id="run_123",
+                turn_number=0,
+                agent_id=canonical_agent_id(f"agent{i}.bsky.social"),
+                agent_handle=f"agent{i}.bsky.social",
+                post_ids=[f"post_{i}"],
+                created_at="2024-01-01T00:00:00Z",
+            )
+            for i in range(2)
+        ]
+        mock_conn = Mock(spec=sqlite3.Connection)
+        written_rows: list[tuple] = []
+        mock_conn.executemany.side_effect = lambda sql, rows: written_rows.extend(rows)
+
+        # Act
+        adapter.write_generated_feeds(feeds, conn=mock_conn)
+
+        # Assert
+        mock_conn.executemany.assert_called_once()
+        mock_conn.execute.assert_not_called()
+        assert len(written_rows) == 2
+        for row, feed in zip(written_rows, feeds, strict=True):
+            assert feed.feed_id in row
+            assert json.dumps(feed.post_ids) in row
+
+
 class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
     """Tests for SQLiteGeneratedFeedAdapter.read_feeds_for_turn method."""
 
@@ -394,6 +394,67 @@ class TestSQLiteRunAdapterReadTurnMetadataForRun:
             assert call_args[0][1] == (run_id,)
 
 
+class TestSQLiteRunAdapterAggregateTurnActionTotals:
+    """Tests for SQLiteRunAdapter.aggregate_turn_action_totals method."""
+
+    def test_maps_grouped_rows_and_zero_fills_missing_actions(
+        self, adapter, mock_db_connection
+    ):
+        run_id = "run_123"
+        rows = [
+            create_mock_row({"action": "like", "total": 4}),
+            create_mock_row({"action": "comment", "total": 1}),
+        ]
+        expected_result = {
+            **dict.fromkeys(TurnAction, 0),
+            TurnAction.LIKE: 4,
+            TurnAction.COMMENT: 1,
+        }
+
+        with mock_db_connection() as (mock_conn, mock_cursor):
+            mock_cursor.fetchall.return_value = rows
+
+            result = adapter.aggregate_turn_action_totals(run_id, conn=mock_conn)
+
+            assert result == expected_result
+
+    def test_returns_all_zero_totals_when_no_rows(self, adapter, mock_db_connection):
+        with mock_db_connection() as (mock_conn, mock_cursor):
+            mock_cursor.fetchall.return_value = []
+
+            result = adapter.aggregate_turn_action_totals("run_123", conn=mock_conn)
+
+            assert result == dict.fromkeys(TurnAction, 0)
+
+    def test_groups_by_action_in_sql(self, adapter, mock_db_connection):
+        run_id = "run_123"
+
+        with mock_db_connection() as (mock_conn, mock_cursor):
+            mock_cursor.fetchall.return_value = []
+
+            adapter.aggregate_turn_action_totals(run_id, conn=mock_conn)
+
+            mock_conn.execute.assert_called_once()
+            query, params = mock_conn.execute.call_args[0]
+            assert "json_each(turns.total_actions)" in query
+            assert "GROUP BY" in query
+            assert params == (run_id,)
+
+    def test_raises_valueerror_for_unknown_action(self, adapter, mock_db_connection):
+        with mock_db_connection() as (mock_conn, mock_cursor):
+            mock_cursor.fetchall.return_value = [
+                create_mock_row({"action": "repost", "total": 2})
+            ]
+
+            with pytest.raises(ValueError, match="Invalid action type"):
+                adapter.aggregate_turn_action_totals("run_123", conn=mock_conn)
+
+    def test_raises_valueerror_for_invalid_run_id(self, adapter):
+        mock_conn = Mock()
+        with pytest.raises(ValueError, match="run_id cannot be empty"):
+            adapter.aggregate_turn_action_totals("", conn=mock_conn)
+
+
 class TestSQLiteRunAdapterWriteTurnMetadata:
     """Tests for SQLiteRunAdapter.write_turn_metadata method."""
 
@@ -1,5 +1,6 @@
 """Tests for db.adapters.sqlite.sqlite module."""
 
+import contextlib
 import os
 import sqlite3
 from unittest.mock import patch
@@ -78,6 +79,29 @@ class TestGetConnection:
         expected_result = os.path.realpath(temp_db)
         assert os.path.realpath(connected_path) == expected_result
 
+    def test_connection_applies_performance_pragmas(self, temp_db):
+        """get_connection should relax commit syncing and keep temp storage in memory."""
+        conn = get_connection()
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+        conn.close()
+
+        # synchronous: 1 == NORMAL; temp_store: 2 == MEMORY.
+        assert synchronous == 1
+        assert temp_store == 2
+
+    def test_connection_keeps_full_sync_outside_wal(self, temp_db):
+        """get_connection should not relax syncing for rollback-journal files."""
+        with contextlib.closing(sqlite3.connect(temp_db)) as setup_conn:
+            setup_conn.execute("PRAGMA journal_mode = DELETE")
+
+        conn = get_connection()
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.close()
+
+        # synchronous: 2 == FULL (SQLite default).
+        assert synchronous == 2
+
 
 class TestRunTransaction:
     """Tests for run_transaction context manager."""
@@ -182,6 +206,14 @@ class TestInitializeDatabase:
             assert result is not None
             conn.close()
 
+    def test_enables_wal_journal_mode(self, temp_db):
+        """Test that initialize_database persists WAL journaling on the file."""
+        conn = get_connection()
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+
+        assert journal_mode == "wal"
+
     def test_creates_tables_with_correct_schema(self, temp_db):
         """Test that initialize_database creates tables with correct schema."""
         with patch("db.adapters.sqlite.sqlite.DB_PATH", temp_db):
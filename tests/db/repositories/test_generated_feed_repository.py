@@ -168,6 +168,28 @@ class TestSQLiteGeneratedFeedRepositoryCreateOrUpdateGeneratedFeed:
         assert mock_adapter.write_generated_feed.call_args[1]["conn"] is not None
 
 
+class TestSQLiteGeneratedFeedRepositoryWriteGeneratedFeeds:
+    """Tests for SQLiteGeneratedFeedRepository.write_generated_feeds method."""
+
+    def test_forwards_feeds_to_adapter_with_caller_connection(self):
+        """Test that a caller-owned connection is passed straight to the adapter."""
+        # Arrange
+        mock_adapter = Mock(spec=GeneratedFeedDatabaseAdapter)
+        repo = SQLiteGeneratedFeedRepository(
+            db_adapter=mock_adapter,
+            transaction_provider=make_mock_transaction_provider(),
+        )
+        feeds = [GeneratedFeedFactory.create(), GeneratedFeedFactory.create()]
+        conn = object()
+
+        # Act
+        repo.write_generated_feeds(feeds, conn=conn)
+
+        # Assert
+        mock_adapter.write_generated_feeds.assert_called_once_with(feeds, conn=conn)
+        mock_adapter.write_generated_feed.assert_not_called()
+
+
 class TestSQLiteGeneratedFeedRepositoryGetGeneratedFeed:
     """Tests for SQLiteGeneratedFeedRepository.get_generated_feed method."""
 
@@ -1582,6 +1582,44 @@ class TestSQLiteRunRepositoryListTurnMetadata:
             repo.list_turn_metadata(run_id)
 
 
+class TestSQLiteRunRepositoryAggregateActionTotals:
+    """Tests for SQLiteRunRepository.aggregate_action_totals method."""
+
+    def test_delegates_to_adapter_with_connection(self):
+        mock_adapter = Mock(spec=RunDatabaseAdapter)
+        mock_get_timestamp = Mock(return_value="2024_01_01-12:00:00")
+        repo = SQLiteRunRepository(
+            db_adapter=mock_adapter, get_timestamp=mock_get_timestamp
+        )
+        run_id = "run_123"
+        expected_result = {
+            TurnAction.LIKE: 3,
+            TurnAction.COMMENT: 0,
+            TurnAction.FOLLOW: 1,
+        }
+        mock_adapter.aggregate_turn_action_totals.return_value = expected_result
+
+        result = repo.aggregate_action_totals(run_id)
+
+        assert result == expected_result
+        mock_adapter.aggregate_turn_action_totals.assert_called_once()
+        call_args = mock_adapter.aggregate_turn_action_totals.call_args
+        assert call_args[0][0] == run_id
+        assert call_args[1]["conn"] is not None
+
+    def test_raises_valueerror_for_empty_run_id(self):
+        mock_adapter = Mock(spec=RunDatabaseAdapter)
+        mock_get_timestamp = Mock(return_value="2024_01_01-12:00:00")
+        repo = SQLiteRunRepository(
+            db_adapter=mock_adapter, get_timestamp=mock_get_timestamp
+        )
+
+        with pytest.raises(ValueError, match="run_id cannot be empty"):
+            repo.aggregate_action_totals("")
+
+        mock_adapter.aggregate_turn_action_totals.assert_not_called()
+
+
 class TestSQLiteRunRepositoryWriteTurnMetadata:
     """Tests for SQLiteRunRepository.write_turn_metadata method."""
 
@@ -1010,3 +1010,66 @@ class TestTurnMetadataIntegration:
         assert len(result_run_2) == 1
         assert result_run_1[0].run_id == run_1.run_id
         assert result_run_2[0].run_id == run_2.run_id
+
+    def test_aggregate_action_totals_sums_turns_for_run_only(self, temp_db, run_repo):
+        """Test SQL-side action totals sum every turn of one run and zero-fill."""
+        from lib.timestamp_utils import get_current_timestamp
+        from simulation.core.models.actions import TurnAction
+
+        repo = run_repo
+        run = repo.create_run(
+            RunConfigFactory.create(
+                num_agents=2, num_turns=3, feed_algorithm="chronological"
+            )
+        )
+        other_run = repo.create_run(
+            RunConfigFactory.create(
+                num_agents=2, num_turns=3, feed_algorithm="chronological"
+            )
+        )
+        for turn_number, total_actions in enumerate(
+            [
+                {TurnAction.LIKE: 2, TurnAction.COMMENT: 1},
+                {TurnAction.LIKE: 3},
+            ]
+        ):
+            repo.write_turn_metadata(
+                TurnMetadataFactory.create(
+                    run_id=run.run_id,
+                    turn_number=turn_number,
+                    total_actions=total_actions,
+                    created_at=get_current_timestamp(),
+                )
+            )
+        repo.write_turn_metadata(
+            TurnMetadataFactory.create(
+                run_id=other_run.run_id,
+                turn_number=0,
+                total_actions={TurnAction.LIKE: 100},
+                created_at=get_current_timestamp(),
+            )
+        )
+
+        result = repo.aggregate_action_totals(run.run_id)
+
+        assert result == {
+            **dict.fromkeys(TurnAction, 0),
+            TurnAction.LIKE: 5,
+            TurnAction.COMMENT: 1,
+        }
+
+    def test_aggregate_action_totals_returns_zeros_for_run_without_turns(
+        self, temp_db, run_repo
+    ):
+        """Test SQL-side action totals are all zero when no turns exist."""
+        from simulation.core.models.actions import TurnAction
+
+        run = run_repo.create_run(
+            RunConfigFactory.create(
+                num_agents=2, num_turns=3, feed_algorithm="chronological"
+            )
+        )
+
+        result = run_repo.aggregate_action_totals(run.run_id)
+
+        assert result == dict.fromkeys(TurnAction, 0)
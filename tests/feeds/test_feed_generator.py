@@ -13,7 +13,11 @@ from db.repositories.interfaces import (
 )
 from feeds.algorithms.implementations.chronological import ChronologicalFeedAlgorithm
 from feeds.algorithms.interfaces import FeedAlgorithmResult
-from feeds.feed_generator import _generate_feed, generate_feeds
+from feeds.feed_generator import (
+    _generate_feed,
+    _log_warning_missing_posts,
+    generate_feeds,
+)
 from feeds.interfaces import FeedGenerationResult
 from lib.agent_id import canonical_agent_id
 from simulation.core.models.feeds import GeneratedFeed
@@ -46,6 +50,7 @@ def mock_run_post_repo(sample_posts):
         for p in sample_posts
     ]
     mock.read_run_posts_by_ids.return_value = snapshots
+    mock.list_run_posts.return_value = []
     return mock
 
 
@@ -75,6 +80,7 @@ def mock_run_post_comment_repo():
 def mock_turn_post_repo():
     mock = Mock(spec=TurnPostRepository)
     mock.read_turn_posts_by_ids.return_value = []
+    mock.list_turn_posts_for_run_before_turn.return_value = []
     return mock
 
 
@@ -332,11 +338,20 @@ class TestGenerateFeeds:
         assert call_args.args[0] == run_id
         # Verify load_candidate_posts was called for each agent
         assert mock_load_candidate_posts.call_count == 2
+        # Run + prior-turn posts are loaded once for the turn, not per agent
+        mock_run_post_repo.list_run_posts.assert_called_once_with(run_id)
+        mock_turn_post_repo.list_turn_posts_for_run_before_turn.assert_called_once_with(
+            run_id, turn_number
+        )
+        for call in mock_load_candidate_posts.call_args_list:
+            assert call.kwargs["posts"] == []
 
+    @patch("feeds.feed_generator.load_posts", return_value=[])
     @patch("feeds.feed_generator.load_candidate_posts")
     def test_uses_batch_queries_for_post_hydration(
         self,
         mock_load_candidate_posts,
+        mock_load_posts,
         mock_generated_feed_repo,
         mock_run_post_repo,
         mock_run_post_like_repo,
@@ -749,6 +764,7 @@ class TestGenerateFeeds:
 
         mock_run_post_repo = Mock(spec=RunPostRepository)
         mock_run_post_repo.read_run_posts_by_ids.return_value = run_post_snapshots
+        mock_run_post_repo.list_run_posts.return_value = []
 
         result = generate_feeds(
             agents=[sample_agent],
@@ -770,3 +786,18 @@ class TestGenerateFeeds:
         assert hydrated.source == PostSource.SEED_STATE
         assert hydrated.post_id == "rp_aaa"
         assert hydrated.text == "Post from run_posts"
+
+
+class TestLogWarningMissingPosts:
+    @patch("feeds.feed_generator.logger")
+    def test_skips_formatting_when_warning_disabled(self, mock_logger):
+        """Returns before per-agent lookups when WARNING is filtered out."""
+        mock_logger.isEnabledFor.return_value = False
+        _log_warning_missing_posts(
+            {"agent1.bsky.social": ["post1", "post2"]},
+            {},
+            run_id="run_123",
+            turn_number=0,
+        )
+
+        mock_logger.warning.assert_not_called()
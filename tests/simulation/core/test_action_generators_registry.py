@@ -1,5 +1,7 @@
 """Tests for simulation.core.action_generators.registry module."""
 
+from unittest.mock import patch
+
 import pytest
 
 from simulation.core.action_generators.interfaces import (
@@ -43,6 +45,17 @@ class TestGetLikeGenerator:
         expected_result = explicit_generator
         assert default_generator is expected_result
 
+    def test_repeat_default_lookup_skips_config_resolution(self):
+        """Cached default lookups do not re-resolve the configured algorithm."""
+        g1 = get_like_generator()
+        with patch(
+            "simulation.core.action_generators.registry.resolve_algorithm"
+        ) as mock_resolve:
+            g2 = get_like_generator()
+        mock_resolve.assert_not_called()
+        expected_result = g1
+        assert g2 is expected_result
+
     def test_get_like_generator_naive_llm(self):
         """get_like_generator returns NaiveLLMLikeGenerator for naive_llm."""
         generator = get_like_generator(algorithm="naive_llm")
@@ -2,7 +2,12 @@
 
 import pytest
 
-from simulation.core.action_generators.validators import validate_algorithm
+from simulation.core.action_generators.validators import (
+    validate_algorithm,
+    validate_comment_algorithm,
+    validate_follow_algorithm,
+    validate_like_algorithm,
+)
 
 
 class TestActionGeneratorsValidators:
@@ -30,3 +35,23 @@ class TestActionGeneratorsValidators:
         """Unknown algorithm for action type raises ValueError."""
         with pytest.raises(ValueError, match="must be one of"):
             validate_algorithm("like", "unknown")
+
+    @pytest.mark.parametrize(
+        "validator",
+        [
+            validate_like_algorithm,
+            validate_follow_algorithm,
+            validate_comment_algorithm,
+        ],
+    )
+    def test_specialized_validators_accept_naive_llm(self, validator):
+        """Per-action validators accept every registered algorithm."""
+        assert validator("naive_llm") == "naive_llm"
+
+    def test_specialized_validator_matches_generic_error(self):
+        """Per-action validators raise the same message as validate_algorithm."""
+        with pytest.raises(ValueError) as generic:
+            validate_algorithm("follow", "unknown")
+        with pytest.raises(ValueError) as specialized:
+            validate_follow_algorithm("unknown")
+        assert str(specialized.value) == str(generic.value)
@@ -1,7 +1,11 @@
 """Tests for action history recording helpers."""
 
 from lib.agent_id import canonical_agent_id
-from simulation.core.action_history.recording import record_action_targets
+from simulation.core.action_history.interfaces import AgentActionTargetRecord
+from simulation.core.action_history.recording import (
+    record_action_targets,
+    record_turn_action_targets,
+)
 from simulation.core.action_history.stores import InMemoryActionHistoryStore
 
 
@@ -23,3 +27,48 @@ class TestActionHistoryRecording:
         assert history.has_liked("run_123", actor_id, "post_1")
         assert history.has_commented("run_123", actor_id, "post_2")
         assert history.has_followed("run_123", actor_id, target)
+
+    def test_records_turn_targets_for_all_agents_in_one_call(self) -> None:
+        history = InMemoryActionHistoryStore()
+        first_id = canonical_agent_id("agent1.bsky.social")
+        second_id = canonical_agent_id("agent2.bsky.social")
+        target = canonical_agent_id("user_3")
+
+        record_turn_action_targets(
+            run_id="run_123",
+            records=[
+                AgentActionTargetRecord(
+                    agent_id=first_id,
+                    like_post_ids=["post_1"],
+                    comment_post_ids=[],
+                    follow_target_agent_ids=[target],
+                ),
+                AgentActionTargetRecord(
+                    agent_id=second_id,
+                    like_post_ids=[],
+                    comment_post_ids=["post_2"],
+                    follow_target_agent_ids=[],
+                ),
+            ],
+            action_history_store=history,
+        )
+
+        assert history.has_liked("run_123", first_id, "post_1")
+        assert history.has_followed("run_123", first_id, target)
+        assert history.has_commented("run_123", second_id, "post_2")
+        assert not history.has_liked("run_123", second_id, "post_1")
+        assert second_id not in history._likes_by_run_agent_id["run_123"]
+
+    def test_has_checks_do_not_materialize_history_entries(self) -> None:
+        history = InMemoryActionHistoryStore()
+        actor_id = canonical_agent_id("agent1.bsky.social")
+
+        assert not history.has_liked("run_123", actor_id, "post_1")
+        assert not history.has_commented("run_123", actor_id, "post_1")
+        assert not history.has_followed("run_123", actor_id, "target")
+        targets = history.get_action_targets("run_123", actor_id)
+
+        assert not targets.liked_post_ids
+        assert history._likes_by_run_agent_id == {}
+        assert history._comments_by_run_agent_id == {}
+        assert history._follows_by_run_agent_id == {}
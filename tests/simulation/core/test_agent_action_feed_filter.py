@@ -3,10 +3,27 @@
 from unittest.mock import Mock
 
 from lib.agent_id import canonical_agent_id
+from simulation.core.action_history import (
+    AgentActionTargets,
+    InMemoryActionHistoryStore,
+)
 from simulation.core.action_policy import HistoryAwareActionFeedFilter
 from tests.factories import PostFactory
 
 
+def _targets(
+    *,
+    liked: frozenset[str] = frozenset(),
+    commented: frozenset[str] = frozenset(),
+    followed: frozenset[str] = frozenset(),
+) -> AgentActionTargets:
+    return AgentActionTargets(
+        liked_post_ids=liked,
+        commented_post_ids=commented,
+        followed_agent_ids=followed,
+    )
+
+
 def _build_post(uri: str, author_handle: str):
     return PostFactory.create(
         uri=uri,
@@ -35,9 +52,9 @@ class TestHistoryAwareActionFeedFilterFilterCandidates:
         post_2 = _build_post("post_2", "author2.bsky.social")
         feed = [post_1, post_2]
         action_history_store = Mock()
-        action_history_store.has_liked.side_effect = [True, False]
-        action_history_store.has_commented.return_value = False
-        action_history_store.has_followed.return_value = False
+        action_history_store.get_action_targets.return_value = _targets(
+            liked=frozenset({post_1.post_id})
+        )
         expected = [post_2]
 
         # Act
@@ -50,7 +67,9 @@ class TestHistoryAwareActionFeedFilterFilterCandidates:
         )
 
         # Assert
-        action_history_store.has_liked.assert_any_call(run_id, agent_id, post_1.post_id)
+        action_history_store.get_action_targets.assert_called_once_with(
+            run_id, agent_id
+        )
         assert result.like_candidates == expected
 
     def test_excludes_previously_commented_posts(self):
@@ -63,9 +82,9 @@ class TestHistoryAwareActionFeedFilterFilterCandidates:
         post_2 = _build_post("post_2", "author2.bsky.social")
         feed = [post_1, post_2]
         action_history_store = Mock()
-        action_history_store.has_liked.return_value = False
-        action_history_store.has_commented.side_effect = [False, True]
-        action_history_store.has_followed.return_value = False
+        action_history_store.get_action_targets.return_value = _targets(
+            commented=frozenset({post_2.post_id})
+        )
         expected = [post_1]
 
         # Act
@@ -90,9 +109,9 @@ class TestHistoryAwareActionFeedFilterFilterCandidates:
         post_2 = _build_post("post_2", "author2.bsky.social")
         feed = [post_1, post_2]
         action_history_store = Mock()
-        action_history_store.has_liked.return_value = False
-        action_history_store.has_commented.return_value = False
-        action_history_store.has_followed.side_effect = [True, False]
+        action_history_store.get_action_targets.return_value = _targets(
+            followed=frozenset({post_1.author_agent_id})
+        )
         expected = [post_2]
 
         # Act
@@ -117,9 +136,7 @@ class TestHistoryAwareActionFeedFilterFilterCandidates:
         post_2 = _build_post("post_2", "author2.bsky.social")
         feed = [post_1, post_2]
         action_history_store = Mock()
-        action_history_store.has_liked.return_value = False
-        action_history_store.has_commented.return_value = False
-        action_history_store.has_followed.return_value = False
+        action_history_store.get_action_targets.return_value = _targets()
         expected = [post_1, post_2]
 
         # Act
@@ -135,3 +152,31 @@ class TestHistoryAwareActionFeedFilterFilterCandidates:
         assert result.like_candidates == expected
         assert result.comment_candidates == expected
         assert result.follow_candidates == expected
+
+    def test_in_memory_store_excludes_recorded_targets_per_action(self):
+        """Test that each action is filtered by its own recorded history."""
+        # Arrange
+        run_id = "run_1"
+        agent_handle = "agent.bsky.social"
+        agent_id = canonical_agent_id(agent_handle)
+        post_1 = _build_post("post_1", "author1.bsky.social")
+        post_2 = _build_post("post_2", "author2.bsky.social")
+        feed = [post_1, post_2]
+        action_history_store = InMemoryActionHistoryStore()
+        action_history_store.record_like(run_id, agent_id, post_1.post_id)
+        action_history_store.record_comment(run_id, agent_id, post_2.post_id)
+        action_history_store.record_follow(run_id, agent_id, post_1.author_agent_id)
+
+        # Act
+        result = HistoryAwareActionFeedFilter().filter_candidates(
+            run_id=run_id,
+            agent_handle=agent_handle,
+            agent_id=agent_id,
+            feed=feed,
+            action_history_store=action_history_store,
+        )
+
+        # Assert
+        assert result.like_candidates == [post_2]
+        assert result.comment_candidates == [post_1]
+        assert result.follow_candidates == [post_2]
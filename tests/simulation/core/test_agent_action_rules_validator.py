@@ -1,10 +1,13 @@
 """Tests for simulation.core.action_policy.rules_validator module."""
 
+from unittest.mock import Mock
+
 import pytest
 
 from lib.agent_id import canonical_agent_id
 from simulation.core.action_history import InMemoryActionHistoryStore
 from simulation.core.action_policy import AgentActionRulesValidator
+from simulation.core.action_policy.rules_validator import _collect_target_ids
 from tests.factories import (
     GeneratedCommentFactory,
     GeneratedFollowFactory,
@@ -210,3 +213,26 @@ class TestAgentActionRulesValidator:
         assert comment_post_ids == ["post_2"]
         assert follow_user_ids == [canonical_agent_id("user_3")]
         assert not history.has_liked("run_123", AGENT_CANONICAL_ID, "post_1")
+
+    def test_collect_target_ids_reports_each_repeated_identifier_once(self):
+        ids, duplicates = _collect_target_ids(iter(["a", "b", "a", "c", "b", "a"]))
+        assert ids == ["a", "b", "a", "c", "b", "a"]
+        assert duplicates == ["a", "b"]
+        assert _collect_target_ids(["a", "b", "c"]) == (["a", "b", "c"], [])
+
+    def test_empty_actions_skip_history_lookup(self, policy):
+        history = Mock(spec=InMemoryActionHistoryStore)
+
+        result = policy.validate(
+            run_id="run_123",
+            turn_number=0,
+            agent_handle=AGENT_HANDLE,
+            agent_id=AGENT_CANONICAL_ID,
+            likes=[],
+            comments=[],
+            follows=[],
+            action_history_store=history,
+        )
+
+        assert result == ([], [], [])
+        history.get_action_targets.assert_not_called()
@@ -7,7 +7,10 @@ import pytest
 from db.services.simulation_persistence_service import SimulationPersistenceService
 from feeds.interfaces import FeedGenerationResult, FeedGenerator
 from lib.agent_id import canonical_agent_id
-from simulation.core.action_history import InMemoryActionHistoryStore
+from simulation.core.action_history import (
+    AgentActionTargetRecord,
+    InMemoryActionHistoryStore,
+)
 from simulation.core.action_policy import (
     ActionCandidateFeeds,
     AgentActionRulesValidator,
@@ -20,6 +23,7 @@ from simulation.core.models.agent_follow_edge import AgentFollowEdge
 from simulation.core.models.runs import RunStatus
 from simulation.core.services.command_service import (
     STATUS_UPDATE_BACKOFF_BASE,
+    STATUS_UPDATE_BACKOFF_JITTER,
     STATUS_UPDATE_MAX_ATTEMPTS,
     SimulationCommandService,
 )
@@ -202,19 +206,35 @@ class TestSimulationCommandServiceUpdateRunStatus:
             sample_run.run_id, RunStatus.COMPLETED
         )
 
+    def test_writes_even_when_in_memory_status_matches(
+        self, command_service, mock_repos, sample_run
+    ):
+        command_service.update_run_status(sample_run, sample_run.status)
+        mock_repos["run_repo"].update_run_status.assert_called_once_with(
+            sample_run.run_id, sample_run.status
+        )
+
     def test_retries_then_succeeds(self, command_service, mock_repos, sample_run):
         mock_repos["run_repo"].update_run_status.side_effect = [
             RunStatusUpdateError(sample_run.run_id, "first"),
             RunStatusUpdateError(sample_run.run_id, "second"),
             None,
         ]
-        with patch("simulation.core.utils.retry.time.sleep") as mock_sleep:
-            command_service.update_run_status(sample_run, RunStatus.RUNNING)
+        with (
+            patch("simulation.core.utils.retry.time.sleep") as mock_sleep,
+            patch(
+                "simulation.core.utils.retry.random.uniform", return_value=1.0
+            ) as mock_uniform,
+        ):
+            command_service.update_run_status(sample_run, RunStatus.COMPLETED)
         assert mock_repos["run_repo"].update_run_status.call_count == 3
         assert mock_sleep.call_args_list == [
             ((float(STATUS_UPDATE_BACKOFF_BASE**0),), {}),
             ((float(STATUS_UPDATE_BACKOFF_BASE**1),), {}),
         ]
+        mock_uniform.assert_called_with(
+            1.0 - STATUS_UPDATE_BACKOFF_JITTER, 1.0 + STATUS_UPDATE_BACKOFF_JITTER
+        )
 
     def test_retries_then_fails_marks_run_failed(
         self, command_service, mock_repos, sample_run
@@ -223,7 +243,7 @@ class TestSimulationCommandServiceUpdateRunStatus:
 
         def _update_run_status(run_id: str, status: RunStatus) -> None:
             nonlocal attempts
-            if status == RunStatus.RUNNING:
+            if status == RunStatus.COMPLETED:
                 attempts += 1
                 raise RunStatusUpdateError(run_id, "transient")
             if status == RunStatus.FAILED:
@@ -231,13 +251,16 @@ class TestSimulationCommandServiceUpdateRunStatus:
             raise AssertionError(f"Unexpected status: {status}")
 
         mock_repos["run_repo"].update_run_status.side_effect = _update_run_status
-        with patch("simulation.core.utils.retry.time.sleep") as mock_sleep:
+        with (
+            patch("simulation.core.utils.retry.time.sleep") as mock_sleep,
+            patch("simulation.core.utils.retry.random.uniform", return_value=1.0),
+        ):
             with pytest.raises(RunStatusUpdateError) as exc_info:
-                command_service.update_run_status(sample_run, RunStatus.RUNNING)
+                command_service.update_run_status(sample_run, RunStatus.COMPLETED)
 
         assert exc_info.value.run_id == sample_run.run_id
         assert (
-            f"Failed to update status to {RunStatus.RUNNING.value} after {STATUS_UPDATE_MAX_ATTEMPTS} attempts"
+            f"Failed to update status to {RunStatus.COMPLETED.value} after {STATUS_UPDATE_MAX_ATTEMPTS} attempts"
             in str(exc_info.value)
         )
         assert attempts == STATUS_UPDATE_MAX_ATTEMPTS
@@ -251,6 +274,27 @@ class TestSimulationCommandServiceUpdateRunStatus:
         ]
 
 
+class TestSimulationCommandServiceCreateAgentsForRun:
+    def test_duplicate_handles_raise_with_each_handle_reported_once(
+        self, command_service, mock_agent_factory
+    ):
+        mock_agent_factory.side_effect = None
+        mock_agent_factory.return_value = [
+            AgentFactory.create(handle="agent1.bsky.social"),
+            AgentFactory.create(handle="agent2.bsky.social"),
+            AgentFactory.create(handle="agent1.bsky.social"),
+            AgentFactory.create(handle="agent1.bsky.social"),
+        ]
+        config = RunConfigFactory.create(num_agents=4)
+
+        with pytest.raises(ValueError) as exc_info:
+            command_service._create_agents_for_run(config, "run_123")
+
+        assert "Duplicate agent handles found: {'agent1.bsky.social'}" in str(
+            exc_info.value
+        )
+
+
 class TestSimulationCommandServiceExecuteRun:
     def _make_config(self, turns: int = 2):
         return type(
@@ -261,6 +305,7 @@ class TestSimulationCommandServiceExecuteRun:
                 "num_agents": 2,
                 "num_turns": turns,
                 "feed_algorithm_config": None,
+                "turn_parallelism": 1,
                 "metric_keys": [
                     "run.actions.total",
                     "run.actions.total_by_type",
@@ -296,10 +341,9 @@ class TestSimulationCommandServiceExecuteRun:
 
         assert result == sample_run
         assert mock_sim_turn.call_count == 2
-        # RUNNING at start; COMPLETED is set inside write_run (persistence layer)
-        mock_repos["run_repo"].update_run_status.assert_called_once_with(
-            sample_run.run_id, RunStatus.RUNNING
-        )
+        # create_run already returns a RUNNING run; COMPLETED is set inside
+        # write_run (persistence layer)
+        mock_repos["run_repo"].update_run_status.assert_not_called()
         command_service.simulation_persistence.write_run.assert_called_once()
         call_args = command_service.simulation_persistence.write_run.call_args
         assert call_args[0][0] == sample_run.run_id
@@ -623,8 +667,7 @@ class TestSimulationCommandServiceExecuteRun:
 
         assert exc_info.value.run_id == sample_run.run_id
         calls = mock_repos["run_repo"].update_run_status.call_args_list
-        assert calls[0][0] == (sample_run.run_id, RunStatus.RUNNING)
-        assert calls[1][0] == (sample_run.run_id, RunStatus.FAILED)
+        assert calls[0][0] == (sample_run.run_id, RunStatus.FAILED)
 
     def test_policy_violation_during_turn_marks_failed(
         self, command_service, mock_repos, sample_run, mock_agent_factory
@@ -645,9 +688,10 @@ class TestSimulationCommandServiceExecuteRun:
             command_service.execute_run(self._make_config(turns=1))
 
         assert exc_info.value.run_id == sample_run.run_id
-        calls = mock_repos["run_repo"].update_run_status.call_args_list
-        assert calls[0][0] == (sample_run.run_id, RunStatus.RUNNING)
-        assert calls[1][0] == (sample_run.run_id, RunStatus.FAILED)
+        # Only execute_run marks the run FAILED; the failing turn does not.
+        mock_repos["run_repo"].update_run_status.assert_called_once_with(
+            sample_run.run_id, RunStatus.FAILED
+        )
 
     def test_simulate_turn_aggregates_actions_when_policy_passes(
         self, command_service, mock_repos, sample_run
@@ -752,28 +796,127 @@ class TestSimulationCommandServiceExecuteRun:
                 agents=[agent],
                 feed_algorithm="chronological",
                 action_history_store=action_history_store,
-                turn_metric_keys=DEFAULT_TURN_METRIC_KEYS,
+                turn_metric_keys=list(DEFAULT_TURN_METRIC_KEYS),
             )
 
         assert result.total_actions[TurnAction.LIKE] == 1
         assert result.total_actions[TurnAction.COMMENT] == 1
         assert result.total_actions[TurnAction.FOLLOW] == 1
+        assert isinstance(result.execution_time_ms, int)
+        assert result.execution_time_ms >= 0
         command_service.agent_action_rules_validator.validate.assert_called_once()
-        action_history_store.record_like.assert_called_once_with(
+        agent_id = agent.agent_id
+        assert agent_id is not None
+        action_history_store.record_turn_targets.assert_called_once_with(
             sample_run.run_id,
-            agent.agent_id,
-            canonical_post_id,
+            [
+                AgentActionTargetRecord(
+                    agent_id=agent_id,
+                    like_post_ids=[canonical_post_id],
+                    comment_post_ids=[canonical_post_id],
+                    follow_target_agent_ids=[canonical_agent_id("user_1")],
+                )
+            ],
         )
-        action_history_store.record_comment.assert_called_once_with(
-            sample_run.run_id,
-            agent.agent_id,
-            canonical_post_id,
+
+    def test_simulate_turn_rejects_too_many_missing_feeds_before_generating(
+        self, command_service, sample_run
+    ):
+        agents = [AgentFactory.create(handle=f"agent{i}.bsky.social") for i in range(4)]
+        command_service.feed_generator.generate_feeds.side_effect = None
+        command_service.feed_generator.generate_feeds.return_value = (
+            FeedGenerationResult(
+                generated_feeds_by_agent={},
+                hydrated_feeds_by_agent={
+                    agents[0].handle: [],
+                    agents[1].handle: [],
+                },
+            )
         )
-        action_history_store.record_follow.assert_called_once_with(
-            sample_run.run_id,
-            agent.agent_id,
-            canonical_agent_id("user_1"),
+        mock_generate_likes = Mock(return_value=[])
+
+        with (
+            patch(
+                "simulation.core.services.command_service.generate_likes",
+                mock_generate_likes,
+            ),
+            pytest.raises(ValueError, match="Too many empty feeds: 2/4"),
+        ):
+            command_service._simulate_turn(
+                run=sample_run,
+                turn_number=0,
+                agents=agents,
+                feed_algorithm="chronological",
+                action_history_store=Mock(),
+                turn_metric_keys=list(DEFAULT_TURN_METRIC_KEYS),
+            )
+
+        mock_generate_likes.assert_not_called()
+
+    def test_simulate_turn_parallel_agents_keep_agent_order(
+        self, command_service, sample_run
+    ):
+        agents = [AgentFactory.create(handle=f"agent{i}.bsky.social") for i in range(3)]
+        feed_post = PostFactory.create(uri="post_1")
+        command_service.feed_generator.generate_feeds.side_effect = None
+        command_service.feed_generator.generate_feeds.return_value = (
+            FeedGenerationResult(
+                generated_feeds_by_agent={},
+                hydrated_feeds_by_agent={agent.handle: [feed_post] for agent in agents},
+            )
         )
+        command_service.agent_action_feed_filter = HistoryAwareActionFeedFilter()
+        command_service.agent_action_rules_validator = AgentActionRulesValidator()
+
+        # Factories need the test's Faker context, so build likes up front.
+        likes_by_handle = {
+            agent.handle: GeneratedLikeFactory.create(
+                like=LikeFactory.create(
+                    like_id=f"like_{agent.handle}",
+                    agent_id=agent.agent_id,
+                    post_id=feed_post.post_id,
+                ),
+            )
+            for agent in agents
+        }
+
+        def _generate_likes(candidates, *, agent_handle, **kwargs):
+            return [likes_by_handle[agent_handle]]
+
+        action_history_store = InMemoryActionHistoryStore()
+        with (
+            patch(
+                "simulation.core.services.command_service.generate_likes",
+                side_effect=_generate_likes,
+            ),
+            patch(
+                "simulation.core.services.command_service.generate_posts",
+                Mock(return_value=[]),
+            ),
+        ):
+            result = command_service._simulate_turn(
+                run=sample_run,
+                turn_number=0,
+                agents=agents,
+                feed_algorithm="chronological",
+                action_history_store=action_history_store,
+                turn_metric_keys=list(DEFAULT_TURN_METRIC_KEYS),
+                turn_parallelism=3,
+            )
+
+        assert result.total_actions[TurnAction.LIKE] == 3
+        written_likes = command_service.simulation_persistence.write_turn.call_args[1][
+            "likes"
+        ]
+        assert [like.like.like_id for like in written_likes] == [
+            f"like_{agent.handle}" for agent in agents
+        ]
+        for agent in agents:
+            agent_id = agent.agent_id
+            assert agent_id is not None
+            assert action_history_store.has_liked(
+                sample_run.run_id, agent_id, feed_post.post_id
+            )
 
     def test_simulate_turn_uses_action_specific_filtered_candidates(
         self, command_service, mock_repos, sample_run
@@ -869,7 +1012,7 @@ class TestSimulationCommandServiceExecuteRun:
                 agents=[agent],
                 feed_algorithm="chronological",
                 action_history_store=action_history_store,
-                turn_metric_keys=DEFAULT_TURN_METRIC_KEYS,
+                turn_metric_keys=list(DEFAULT_TURN_METRIC_KEYS),
             )
 
         expected_total_actions = {
@@ -957,7 +1100,7 @@ class TestSimulationCommandServiceExecuteRun:
                 agents=[agent],
                 feed_algorithm="chronological",
                 action_history_store=action_history_store,
-                turn_metric_keys=DEFAULT_TURN_METRIC_KEYS,
+                turn_metric_keys=list(DEFAULT_TURN_METRIC_KEYS),
             )
 
         expected_min_likes = 1
@@ -1168,7 +1311,7 @@ class TestSimulationCommandServiceActionPersistence:
                 agents=[agent],
                 feed_algorithm="chronological",
                 action_history_store=action_history_store,
-                turn_metric_keys=DEFAULT_TURN_METRIC_KEYS,
+                turn_metric_keys=list(DEFAULT_TURN_METRIC_KEYS),
             )
 
         persisted_likes = like_repo.read_likes_by_run_turn(run_id, 0)
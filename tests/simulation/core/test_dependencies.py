@@ -30,6 +30,10 @@ from db.repositories.profile_repository import ProfileRepository
 from db.repositories.run_repository import RunRepository
 from db.repositories.turn_post_repository import SQLiteTurnPostRepository
 from db.services.simulation_persistence_service import SimulationPersistenceService
+from simulation.core.action_policy import (
+    AgentActionRulesValidator,
+    HistoryAwareActionFeedFilter,
+)
 from simulation.core.engine import SimulationEngine
 from simulation.core.factories import (
     AgentRepos,
@@ -222,6 +226,38 @@ class TestCreateEngine:
         assert isinstance(engine.command_service, SimulationCommandService)
 
 
+def _make_command_service_repos() -> CommandServiceRepos:
+    return CommandServiceRepos(
+        agent=AgentRepos(
+            agent_repo=Mock(spec=AgentRepository),
+            agent_bio_repo=Mock(spec=AgentBioRepository),
+            agent_follow_edge_repo=Mock(spec=AgentFollowEdgeRepository),
+            user_agent_profile_metadata_repo=Mock(
+                spec=UserAgentProfileMetadataRepository
+            ),
+            agent_post_repo=Mock(spec=AgentPostRepository),
+            agent_post_like_repo=Mock(spec=AgentPostLikeRepository),
+            agent_post_comment_repo=Mock(spec=AgentPostCommentRepository),
+        ),
+        run=RunRepos(
+            run_repo=Mock(spec=RunRepository),
+            metrics_repo=Mock(spec=MetricsRepository),
+            run_agent_repo=Mock(spec=RunAgentRepository),
+            run_follow_edge_repo=Mock(spec=RunFollowEdgeRepository),
+            run_post_repo=Mock(spec=RunPostRepository),
+            run_post_like_repo=Mock(spec=RunPostLikeRepository),
+            run_post_comment_repo=Mock(spec=RunPostCommentRepository),
+        ),
+        turn=TurnRepos(
+            generated_feed_repo=Mock(spec=GeneratedFeedRepository),
+            turn_post_repo=Mock(spec=TurnPostRepository),
+        ),
+        profile_repo=Mock(spec=ProfileRepository),
+        feed_post_repo=Mock(spec=FeedPostRepository),
+        transaction_provider=Mock(),
+    )
+
+
 class TestServiceBuilders:
     """Tests for create_query_service and create_command_service functions."""
 
@@ -250,35 +286,7 @@ class TestServiceBuilders:
 
     def test_create_command_service(self):
         mock_simulation_persistence = Mock(spec=SimulationPersistenceService)
-        repos = CommandServiceRepos(
-            agent=AgentRepos(
-                agent_repo=Mock(spec=AgentRepository),
-                agent_bio_repo=Mock(spec=AgentBioRepository),
-                agent_follow_edge_repo=Mock(spec=AgentFollowEdgeRepository),
-                user_agent_profile_metadata_repo=Mock(
-                    spec=UserAgentProfileMetadataRepository
-                ),
-                agent_post_repo=Mock(spec=AgentPostRepository),
-                agent_post_like_repo=Mock(spec=AgentPostLikeRepository),
-                agent_post_comment_repo=Mock(spec=AgentPostCommentRepository),
-            ),
-            run=RunRepos(
-                run_repo=Mock(spec=RunRepository),
-                metrics_repo=Mock(spec=MetricsRepository),
-                run_agent_repo=Mock(spec=RunAgentRepository),
-                run_follow_edge_repo=Mock(spec=RunFollowEdgeRepository),
-                run_post_repo=Mock(spec=RunPostRepository),
-                run_post_like_repo=Mock(spec=RunPostLikeRepository),
-                run_post_comment_repo=Mock(spec=RunPostCommentRepository),
-            ),
-            turn=TurnRepos(
-                generated_feed_repo=Mock(spec=GeneratedFeedRepository),
-                turn_post_repo=Mock(spec=TurnPostRepository),
-            ),
-            profile_repo=Mock(spec=ProfileRepository),
-            feed_post_repo=Mock(spec=FeedPostRepository),
-            transaction_provider=Mock(),
-        )
+        repos = _make_command_service_repos()
         service = create_command_service(
             repos=repos,
             simulation_persistence=mock_simulation_persistence,
@@ -288,6 +296,53 @@ class TestServiceBuilders:
         assert service.agent_follow_edge_repo is not None
         assert service.run_follow_edge_repo is not None
 
+    def test_create_command_service_shares_default_action_policies(self):
+        # Arrange
+        def build() -> SimulationCommandService:
+            return create_command_service(
+                repos=_make_command_service_repos(),
+                simulation_persistence=Mock(spec=SimulationPersistenceService),
+                agent_factory=Mock(return_value=[]),
+            )
+
+        # Act
+        first = build()
+        second = build()
+
+        # Assert
+        assert isinstance(first.agent_action_rules_validator, AgentActionRulesValidator)
+        assert isinstance(first.agent_action_feed_filter, HistoryAwareActionFeedFilter)
+        assert first.agent_action_rules_validator is second.agent_action_rules_validator
+        assert first.agent_action_feed_filter is second.agent_action_feed_filter
+
+    def test_create_command_service_shares_default_metrics_registry(self):
+        # Arrange
+        def build() -> SimulationCommandService:
+            return create_command_service(
+                repos=_make_command_service_repos(),
+                simulation_persistence=Mock(spec=SimulationPersistenceService),
+                agent_factory=Mock(return_value=[]),
+            )
+
+        # Act
+        first = build()
+        second = build()
+
+        # Assert
+        assert first.metrics_collector is not second.metrics_collector
+        assert first.metrics_collector._registry is second.metrics_collector._registry
+
+
+def _seed_agents_up_to_limit(
+    agents: list[SimulationAgent],
+) -> Callable[..., list[SimulationAgent]]:
+    """Side effect mirroring the seed-state helper's ``limit`` handling."""
+
+    def create(*, limit: int | None = None, **_: object) -> list[SimulationAgent]:
+        return agents[:limit]
+
+    return create
+
 
 class TestCreateDefaultAgentFactory:
     """Tests for create_default_agent_factory function."""
@@ -307,7 +362,7 @@ class TestCreateDefaultAgentFactory:
         mock_agents = [
             AgentFactory.create(handle=f"agent{i}.bsky.social") for i in range(10)
         ]
-        mock_create_agents.return_value = mock_agents
+        mock_create_agents.side_effect = _seed_agents_up_to_limit(mock_agents)
         (
             agent_repo,
             agent_bio_repo,
@@ -327,6 +382,7 @@ class TestCreateDefaultAgentFactory:
             agent_bio_repo=agent_bio_repo,
             user_agent_profile_metadata_repo=user_agent_profile_metadata_repo,
             feed_post_repo=feed_post_repo,
+            limit=5,
         )
 
     @patch("simulation.core.factories.agent._create_simulation_agents_from_seed_state")
@@ -337,7 +393,7 @@ class TestCreateDefaultAgentFactory:
         mock_agents = [
             AgentFactory.create(handle=f"agent{i}.bsky.social") for i in range(10)
         ]
-        mock_create_agents.return_value = mock_agents
+        mock_create_agents.side_effect = _seed_agents_up_to_limit(mock_agents)
         _, _, _, _, factory = _make_agent_factory_with_mocks()
 
         # Act
@@ -374,7 +430,7 @@ class TestCreateDefaultAgentFactory:
         mock_agents = [
             AgentFactory.create(handle=f"agent{i}.bsky.social") for i in range(3)
         ]
-        mock_create_agents.return_value = mock_agents
+        mock_create_agents.side_effect = _seed_agents_up_to_limit(mock_agents)
         _, _, _, _, factory = _make_agent_factory_with_mocks()
 
         # Act & Assert
@@ -394,7 +450,7 @@ class TestCreateDefaultAgentFactory:
         mock_agents = [
             AgentFactory.create(handle=f"agent{i}.bsky.social") for i in range(3)
         ]
-        mock_create_agents.return_value = mock_agents
+        mock_create_agents.side_effect = _seed_agents_up_to_limit(mock_agents)
         _, _, _, _, factory = _make_agent_factory_with_mocks()
 
         # Act
@@ -411,7 +467,7 @@ class TestCreateDefaultAgentFactory:
         mock_agents = [
             AgentFactory.create(handle=f"agent{i}.bsky.social") for i in range(10)
         ]
-        mock_create_agents.return_value = mock_agents
+        mock_create_agents.side_effect = _seed_agents_up_to_limit(mock_agents)
         _, _, _, _, factory = _make_agent_factory_with_mocks()
 
         # Act
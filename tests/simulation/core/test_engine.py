@@ -1,14 +1,15 @@
 """Facade tests for simulation.core.engine module."""
 
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
+from simulation.core import engine as engine_module
 from simulation.core.engine import SimulationEngine
 from simulation.core.models.runs import RunStatus
 from simulation.core.services.command_service import SimulationCommandService
 from simulation.core.services.query_service import SimulationQueryService
-from tests.factories import AgentFactory, RunFactory
+from tests.factories import AgentFactory, RunConfigFactory, RunFactory
 
 
 @pytest.fixture
@@ -175,3 +176,149 @@ class TestSimulationEngineDelegation:
             turn_metric_keys=["turn.actions.counts_by_type", "turn.actions.total"],
         )
         command_service.create_agents_for_run.assert_called_once_with(run, config)
+
+    def test_reuses_action_history_store_across_turn_calls(
+        self, engine, command_service, action_history_store_factory
+    ):
+        # Arrange
+        run = RunFactory.create(run_id="run_1", total_turns=2)
+        other_run = RunFactory.create(run_id="run_2", total_turns=1)
+        config = RunConfigFactory.create(metric_keys=["turn.actions.total"])
+        agents = [AgentFactory.create(handle="agent1.bsky.social")]
+        action_history_store_factory.side_effect = [Mock(), Mock()]
+
+        # Act
+        engine.simulate_turn(run, config, 0, agents)
+        engine.simulate_turn(run, config, 1, agents)
+        engine.simulate_turns(1, other_run, config, agents)
+
+        # Assert
+        stores = [
+            c.kwargs["action_history_store"]
+            for c in command_service.simulate_turn.call_args_list
+        ]
+        assert stores[0] is stores[1]
+        other_store = command_service.simulate_turns.call_args.kwargs[
+            "action_history_store"
+        ]
+        assert other_store is not stores[0]
+        assert action_history_store_factory.call_count == 2
+
+    @pytest.mark.parametrize("status", [RunStatus.COMPLETED, RunStatus.FAILED])
+    def test_releases_action_history_store_when_run_ends(
+        self, engine, command_service, action_history_store_factory, status
+    ):
+        # Arrange
+        run = RunFactory.create(run_id="run_1", total_turns=2)
+        config = RunConfigFactory.create(metric_keys=["turn.actions.total"])
+        agents = [AgentFactory.create(handle="agent1.bsky.social")]
+        action_history_store_factory.side_effect = [Mock(), Mock()]
+        engine.simulate_turn(run, config, 0, agents)
+
+        # Act
+        engine.update_run_status(run, RunStatus.RUNNING)
+        assert "run_1" in engine._action_history_stores
+        engine.update_run_status(run, status)
+
+        # Assert
+        command_service.update_run_status.assert_called_with(run, status)
+        assert "run_1" not in engine._action_history_stores
+        engine.simulate_turn(run, config, 1, agents)
+        assert action_history_store_factory.call_count == 2
+
+    def test_releases_action_history_store_when_status_write_fails(
+        self, engine, command_service, action_history_store_factory
+    ):
+        # Arrange
+        run = RunFactory.create(run_id="run_1", total_turns=2)
+        config = RunConfigFactory.create(metric_keys=["turn.actions.total"])
+        agents = [AgentFactory.create(handle="agent1.bsky.social")]
+        action_history_store_factory.side_effect = [Mock()]
+        engine.simulate_turn(run, config, 0, agents)
+        command_service.update_run_status.side_effect = RuntimeError("db down")
+
+        # Act
+        with pytest.raises(RuntimeError, match="db down"):
+            engine.update_run_status(run, RunStatus.FAILED)
+
+        # Assert
+        assert "run_1" not in engine._action_history_stores
+
+    def test_releases_action_history_store_when_turn_raises(
+        self, engine, command_service, action_history_store_factory
+    ):
+        # Arrange
+        run = RunFactory.create(run_id="run_1", total_turns=3)
+        config = RunConfigFactory.create(metric_keys=["turn.actions.total"])
+        agents = [AgentFactory.create(handle="agent1.bsky.social")]
+        action_history_store_factory.side_effect = [Mock()]
+        command_service.simulate_turn.side_effect = RuntimeError("turn failed")
+
+        # Act
+        with pytest.raises(RuntimeError, match="turn failed"):
+            engine.simulate_turn(run, config, 0, agents)
+
+        # Assert
+        assert "run_1" not in engine._action_history_stores
+
+    def test_releases_action_history_store_after_last_turn(
+        self, engine, action_history_store_factory
+    ):
+        # Arrange
+        run = RunFactory.create(run_id="run_1", total_turns=2)
+        config = RunConfigFactory.create(metric_keys=["turn.actions.total"])
+        agents = [AgentFactory.create(handle="agent1.bsky.social")]
+        action_history_store_factory.side_effect = [Mock()]
+
+        # Act
+        engine.simulate_turn(run, config, 0, agents)
+        assert "run_1" in engine._action_history_stores
+        engine.simulate_turn(run, config, 1, agents)
+
+        # Assert
+        assert "run_1" not in engine._action_history_stores
+
+    @pytest.mark.parametrize("error", [None, RuntimeError("turn failed")])
+    def test_releases_action_history_store_after_simulate_turns(
+        self, engine, command_service, action_history_store_factory, error
+    ):
+        # Arrange
+        run = RunFactory.create(run_id="run_1", total_turns=2)
+        config = RunConfigFactory.create(metric_keys=["turn.actions.total"])
+        agents = [AgentFactory.create(handle="agent1.bsky.social")]
+        action_history_store_factory.side_effect = [Mock()]
+        command_service.simulate_turns.side_effect = error
+
+        # Act
+        if error is None:
+            engine.simulate_turns(2, run, config, agents)
+        else:
+            with pytest.raises(RuntimeError, match="turn failed"):
+                engine.simulate_turns(2, run, config, agents)
+
+        # Assert
+        assert "run_1" not in engine._action_history_stores
+
+
+class TestGetTurnKeys:
+    def test_resolves_each_metric_key_set_once(self):
+        # Arrange
+        engine_module._resolve_turn_keys.cache_clear()
+        config = RunConfigFactory.create(
+            metric_keys=["run.actions.total", "turn.actions.total"]
+        )
+
+        # Act
+        with patch.object(
+            engine_module,
+            "resolve_metric_keys_by_scope",
+            wraps=engine_module.resolve_metric_keys_by_scope,
+        ) as mock_resolve:
+            first = engine_module._get_turn_keys(config)
+            second = engine_module._get_turn_keys(config)
+
+        # Assert
+        assert first == second == ["turn.actions.total"]
+        assert mock_resolve.call_count == 1
+        first.append("mutated")
+        assert engine_module._get_turn_keys(config) == ["turn.actions.total"]
@@ -325,9 +325,9 @@ class TestMetricsCollector:
             },
             created_at="2026-01-01T00:00:00",
         )
-        run_repo.list_turn_metadata.return_value = [
-            run_repo.get_turn_metadata.return_value
-        ]
+        run_repo.aggregate_action_totals.return_value = dict(
+            run_repo.get_turn_metadata.return_value.total_actions
+        )
 
         deps = MetricDeps(
             run_repo=run_repo, metrics_repo=metrics_repo, sql_executor=None
@@ -357,3 +357,38 @@ class TestMetricsCollector:
             run_metric_keys=["run.actions.total"],
         )
         json.dumps(run_metrics_dict)  # should not raise
+        assert run_metrics_dict["run.actions.total"] == 3
+        run_repo.aggregate_action_totals.assert_called_once_with(run_id)
+        run_repo.list_turn_metadata.assert_not_called()
+
+    def test_counts_by_type_orders_keys_by_action_value(self):
+        """Per-type counts are keyed by action value in sorted order."""
+        run_repo = Mock()
+        run_repo.get_turn_metadata.return_value = TurnMetadataFactory.create(
+            run_id="run_x",
+            turn_number=0,
+            total_actions={
+                TurnAction.POST: 4,
+                TurnAction.FOLLOW: 0,
+                TurnAction.LIKE: 1,
+                TurnAction.COMMENT: 2,
+            },
+            created_at="2026-01-01T00:00:00",
+        )
+        collector = MetricsCollector(
+            registry=create_default_metrics_registry(),
+            turn_metric_keys=["turn.actions.counts_by_type"],
+            run_metric_keys=[],
+            deps=MetricDeps(run_repo=run_repo, metrics_repo=Mock(), sql_executor=None),
+        )
+
+        result = collector.collect_turn_metrics(
+            run_id="run_x",
+            turn_number=0,
+            turn_metric_keys=["turn.actions.counts_by_type", "turn.actions.total"],
+        )
+
+        counts = result["turn.actions.counts_by_type"]
+        assert isinstance(counts, dict)
+        assert list(counts) == sorted(action.value for action in TurnAction)
+        assert result["turn.actions.total"] == 7
@@ -27,14 +27,14 @@ _INT_ADAPTER = TypeAdapter(int)
 
 class TestMetricsDefaults:
     def test_default_metric_key_lists_are_derived_and_ordered(self):
-        assert DEFAULT_TURN_METRIC_KEYS == [
+        assert DEFAULT_TURN_METRIC_KEYS == (
             TurnActionCountsByTypeMetric.KEY,
             TurnActionTotalMetric.KEY,
-        ]
-        assert DEFAULT_RUN_METRIC_KEYS == [
+        )
+        assert DEFAULT_RUN_METRIC_KEYS == (
             RunActionTotalsByTypeMetric.KEY,
             RunActionTotalMetric.KEY,
-        ]
+        )
 
     def test_defaults_duplicate_key_validation_raises(self):
         class _M1(Metric):
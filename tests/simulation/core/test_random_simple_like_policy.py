@@ -130,6 +130,21 @@ class TestRandomSimpleLikeGeneratorGenerate:
         assert post_ids[0] == "bluesky:post_new"
         assert "bluesky:post_new" in post_ids
 
+    def test_score_ties_break_by_post_id(self, monkeypatch):
+        """Equal-score candidates are selected in post_id order, not input order."""
+        monkeypatch.setattr(mod, "LIKE_PROBABILITY", 1.0)
+        generator = RandomSimpleLikeGenerator()
+        candidates = [_post("post_c"), _post("post_a"), _post("post_b")]
+        result = generator.generate(
+            candidates=candidates,
+            run_id="run_1",
+            turn_number=0,
+            agent_handle="agent1.bsky.social",
+            agent_id=canonical_agent_id("agent1.bsky.social"),
+        )
+        post_ids = [like.like.post_id for like in result]
+        assert post_ids == ["bluesky:post_a", "bluesky:post_b"][:TOP_K_POSTS_TO_LIKE]
+
     def test_reproducible_when_random_mocked(self, monkeypatch):
         """With random mocked to fixed values, repeated runs produce same likes."""
         monkeypatch.setattr(mod, "LIKE_PROBABILITY", 1.0)
@@ -0,0 +1,32 @@
+"""Tests for simulation.core.action_generators.utils.random_simple_utils module."""
+
+from simulation.core.action_generators.comment.algorithms import (
+    random_simple as comment_mod,
+)
+from simulation.core.action_generators.follow.algorithms import (
+    random_simple as follow_mod,
+)
+from simulation.core.action_generators.like.algorithms import (
+    random_simple as like_mod,
+)
+from simulation.core.action_generators.utils import random_simple_utils as mod
+
+
+class TestRecencyScore:
+    """Tests for the memoized recency parser."""
+
+    def test_repeated_timestamps_are_parsed_once(self):
+        """A repeated created_at is served from the cache with the same score."""
+        mod.recency_score.cache_clear()
+        first = mod.recency_score("2024_01_01-12:00:00")
+        second = mod.recency_score("2024_01_01-12:00:00")
+        assert second == first
+        assert mod.recency_score.cache_info().misses == 1
+        assert mod.recency_score.cache_info().maxsize == mod.RECENCY_SCORE_CACHE_SIZE
+        assert mod.recency_score("not-a-timestamp") == 0.0
+
+    def test_generators_share_one_cache(self):
+        """All random-simple generators score through the same cached parser."""
+        assert like_mod.recency_score is mod.recency_score
+        assert comment_mod.recency_score is mod.recency_score
+        assert follow_mod.recency_score is mod.recency_score
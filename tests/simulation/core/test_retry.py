@@ -0,0 +1,60 @@
+"""Tests for simulation.core.utils.retry."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from simulation.core.utils.retry import retry_with_exponential_backoff
+
+
+class TestRetryWithExponentialBackoff:
+    def test_caps_delay_at_max_delay(self):
+        # Arrange
+        operation = Mock(side_effect=[ValueError(), ValueError(), ValueError(), "ok"])
+
+        # Act
+        with patch("simulation.core.utils.retry.time.sleep") as mock_sleep:
+            result = retry_with_exponential_backoff(
+                operation=operation,
+                retry_on=ValueError,
+                max_attempts=4,
+                backoff_base=3,
+                max_delay_s=5.0,
+            )
+
+        # Assert
+        assert result == "ok"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 3, 5.0]
+
+    def test_jitter_scales_delay_within_bounds(self):
+        # Arrange
+        operation = Mock(side_effect=[ValueError(), "ok"])
+
+        # Act
+        with (
+            patch("simulation.core.utils.retry.time.sleep") as mock_sleep,
+            patch(
+                "simulation.core.utils.retry.random.uniform", return_value=0.75
+            ) as mock_uniform,
+        ):
+            retry_with_exponential_backoff(
+                operation=operation,
+                retry_on=ValueError,
+                max_attempts=2,
+                backoff_base=2,
+                jitter=0.25,
+            )
+
+        # Assert
+        mock_uniform.assert_called_once_with(0.75, 1.25)
+        mock_sleep.assert_called_once_with(0.75)
+
+    def test_rejects_out_of_range_jitter(self):
+        with pytest.raises(ValueError, match="jitter"):
+            retry_with_exponential_backoff(
+                operation=Mock(),
+                retry_on=ValueError,
+                max_attempts=1,
+                backoff_base=2,
+                jitter=1.5,
+            )